@@ -63,7 +63,7 @@ async def process(self, context: Dict) -> AsyncGenerator[AgentMessage, None]:
         self.raw_text = ""
         self.ocr_confidence = 0
         yield await self.emit("❌ OCR failed", confidence=0)
-        raise Exception("PaddleOCR-VL API failed")
+        raise RuntimeError("PaddleOCR-VL API failed")
     
     # Final message
     yield await self.emit(f"✅ Scanner complete (confidence: {self.ocr_confidence:.1f}%)", confidence=self.ocr_confidence)
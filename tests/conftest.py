@@ -0,0 +1,22 @@
+"""
+Session-wide pytest configuration.
+
+Registers Hypothesis profiles; select one with HYPOTHESIS_PROFILE (defaults
+to Hypothesis' own "default" profile). Importing Hypothesis and pytest-asyncio
+here makes a missing test dependency fail the session at startup.
+"""
+import os
+
+import pytest_asyncio  # noqa: F401
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# CI persists .hypothesis-db between runs so previously failing and shrunk
+# examples are replayed first instead of being rediscovered
+settings.register_profile(
+    "ci",
+    database=DirectoryBasedExampleDatabase(".hypothesis-db"),
+    max_examples=25,
+    deadline=None,
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
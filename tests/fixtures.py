@@ -2,19 +2,23 @@
 Test fixtures for Nhaka 2.0 Archive Resurrection system.
 Provides reusable test data for agents, contexts, and results.
 
+Models here are built with model_construct() since their inputs are known
+to be valid; tests that exercise validation construct models directly.
+
 Requirements: 10.1, 10.2, 10.3, 10.4, 10.5
 """
+import asyncio
+import atexit
 from datetime import datetime
 from typing import Dict, List, Optional
 import pytest
 
 # Import models from main.py
-import sys
-sys.path.insert(0, '.')
 from main import (
     AgentType, ConfidenceLevel, AgentMessage, TextSegment,
-    RepairRecommendation, DamageHotspot, ResurrectionResult
+    RepairRecommendation, DamageHotspot, ResurrectionResult, ScannerAgent
 )
+from tests.generators import FROZEN_NOW
 
 
 # =============================================================================
@@ -33,6 +37,9 @@ Zvakasainwa pamɓeri pezvapupu: Jameson, Colquhoun.
 Ndatenda,
 Loɓengula"""
 
+# Doke characters the Scanner should report for SAMPLE_DOKE_TEXT
+EXPECTED_DOKE_CHARS = frozenset(SAMPLE_DOKE_TEXT).intersection(ScannerAgent.DOKE_CHARACTERS)
+
 SAMPLE_MODERN_TEXT = """Kuna VaRungu vekuBritain,
 Ini Lobengula, Mambo weMatabele, ndinonyora tsamba iyi 
 nezuva re30 Gumiguru 1888. Ndakasaina chibvumirano 
@@ -72,7 +79,7 @@ Ndatenda,
 @pytest.fixture
 def sample_scanner_message() -> AgentMessage:
     """Sample message from Scanner agent."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=AgentType.SCANNER,
         message="📝 OCR extraction complete: 245 characters extracted.",
         confidence=82.5,
@@ -86,7 +93,7 @@ def sample_scanner_message() -> AgentMessage:
 @pytest.fixture
 def sample_linguist_message() -> AgentMessage:
     """Sample message from Linguist agent."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=AgentType.LINGUIST,
         message="📝 TRANSLITERATION: 3 Doke→Modern conversions made.",
         confidence=85.0,
@@ -100,7 +107,7 @@ def sample_linguist_message() -> AgentMessage:
 @pytest.fixture
 def sample_historian_message() -> AgentMessage:
     """Sample message from Historian agent."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=AgentType.HISTORIAN,
         message="👤 KEY FIGURES: Lobengula, Rudd",
         confidence=88.0,
@@ -114,7 +121,7 @@ def sample_historian_message() -> AgentMessage:
 @pytest.fixture
 def sample_validator_message() -> AgentMessage:
     """Sample message from Validator agent."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=AgentType.VALIDATOR,
         message="📈 FINAL CONFIDENCE SCORE: 78.5%",
         confidence=78.5,
@@ -128,7 +135,7 @@ def sample_validator_message() -> AgentMessage:
 @pytest.fixture
 def sample_repair_message() -> AgentMessage:
     """Sample message from Physical Repair Advisor agent."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=AgentType.REPAIR_ADVISOR,
         message="🔍 DAMAGE DETECTED: 2 conservation issues identified.",
         confidence=80.0,
@@ -143,65 +150,65 @@ def sample_repair_message() -> AgentMessage:
 def sample_agent_messages() -> List[AgentMessage]:
     """Complete list of sample agent messages from all agents."""
     return [
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.SCANNER,
             message="🔬 Initializing PaddleOCR-VL forensic scan...",
             confidence=None,
             timestamp=datetime(2024, 1, 15, 10, 30, 0)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.SCANNER,
             message="📝 OCR extraction complete: 245 characters extracted.",
             confidence=82.5,
             document_section="Text Extraction",
             timestamp=datetime(2024, 1, 15, 10, 30, 2)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.LINGUIST,
             message="📚 Initializing Doke Orthography analysis...",
             confidence=None,
             timestamp=datetime(2024, 1, 15, 10, 30, 5)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.LINGUIST,
             message="📝 TRANSLITERATION: 3 Doke→Modern conversions made.",
             confidence=85.0,
             document_section="Transliteration",
             timestamp=datetime(2024, 1, 15, 10, 30, 7)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.HISTORIAN,
             message="📜 Initializing historical analysis engine...",
             confidence=None,
             timestamp=datetime(2024, 1, 15, 10, 30, 10)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.HISTORIAN,
             message="👤 KEY FIGURES: Lobengula, Rudd",
             confidence=88.0,
             document_section="Figure Detection",
             timestamp=datetime(2024, 1, 15, 10, 30, 12)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.VALIDATOR,
             message="🔍 Initializing hallucination detection protocols...",
             confidence=None,
             timestamp=datetime(2024, 1, 15, 10, 30, 15)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.VALIDATOR,
             message="📈 FINAL CONFIDENCE SCORE: 78.5%",
             confidence=78.5,
             document_section="Final Score",
             timestamp=datetime(2024, 1, 15, 10, 30, 17)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.REPAIR_ADVISOR,
             message="🔧 Initializing physical condition assessment...",
             confidence=None,
             timestamp=datetime(2024, 1, 15, 10, 30, 20)
         ),
-        AgentMessage(
+        AgentMessage.model_construct(
             agent=AgentType.REPAIR_ADVISOR,
             message="🔍 DAMAGE DETECTED: 2 conservation issues identified.",
             confidence=80.0,
@@ -218,7 +225,7 @@ def sample_agent_messages() -> List[AgentMessage]:
 @pytest.fixture
 def sample_text_segment_high() -> TextSegment:
     """Sample text segment with high confidence."""
-    return TextSegment(
+    return TextSegment.model_construct(
         text="Kuna VaRungu vekuBritain, Ini Lobengula, Mambo weMatabele",
         confidence=ConfidenceLevel.HIGH,
         original_text="Kuna VaRungu vekuBritain, Ini Loɓengula, Mamɓo weMataɓele",
@@ -229,7 +236,7 @@ def sample_text_segment_high() -> TextSegment:
 @pytest.fixture
 def sample_text_segment_medium() -> TextSegment:
     """Sample text segment with medium confidence."""
-    return TextSegment(
+    return TextSegment.model_construct(
         text="Ndakasaina chibvumirano naCharles Rudd",
         confidence=ConfidenceLevel.MEDIUM,
         original_text="Ndakasaina [unclear] naCharles Rudd",
@@ -240,7 +247,7 @@ def sample_text_segment_medium() -> TextSegment:
 @pytest.fixture
 def sample_text_segment_low() -> TextSegment:
     """Sample text segment with low confidence."""
-    return TextSegment(
+    return TextSegment.model_construct(
         text="[illegible section - approximately 2 lines]",
         confidence=ConfidenceLevel.LOW,
         original_text="[damaged]",
@@ -255,7 +262,7 @@ def sample_text_segment_low() -> TextSegment:
 @pytest.fixture
 def sample_repair_recommendation_critical() -> RepairRecommendation:
     """Sample critical repair recommendation."""
-    return RepairRecommendation(
+    return RepairRecommendation.model_construct(
         issue="Iron-gall ink corrosion",
         severity="critical",
         recommendation="Calcium phytate treatment to neutralize acid",
@@ -266,7 +273,7 @@ def sample_repair_recommendation_critical() -> RepairRecommendation:
 @pytest.fixture
 def sample_repair_recommendation_moderate() -> RepairRecommendation:
     """Sample moderate repair recommendation."""
-    return RepairRecommendation(
+    return RepairRecommendation.model_construct(
         issue="Brown spots from fungal/oxidation damage",
         severity="moderate",
         recommendation="Aqueous deacidification and bleaching",
@@ -278,19 +285,19 @@ def sample_repair_recommendation_moderate() -> RepairRecommendation:
 def sample_repair_recommendations() -> List[RepairRecommendation]:
     """List of sample repair recommendations."""
     return [
-        RepairRecommendation(
+        RepairRecommendation.model_construct(
             issue="Iron-gall ink corrosion",
             severity="critical",
             recommendation="Calcium phytate treatment to neutralize acid",
             estimated_cost="$200-500 per document"
         ),
-        RepairRecommendation(
+        RepairRecommendation.model_construct(
             issue="Brown spots from fungal/oxidation damage",
             severity="moderate",
             recommendation="Aqueous deacidification and bleaching",
             estimated_cost="$100-300 per document"
         ),
-        RepairRecommendation(
+        RepairRecommendation.model_construct(
             issue="Paper brittleness from acid degradation",
             severity="critical",
             recommendation="Mass deacidification (Bookkeeper process)",
@@ -306,7 +313,7 @@ def sample_repair_recommendations() -> List[RepairRecommendation]:
 @pytest.fixture
 def sample_damage_hotspot() -> DamageHotspot:
     """Sample damage hotspot for AR visualization."""
-    return DamageHotspot(
+    return DamageHotspot.model_construct(
         id=1,
         x=25.5,
         y=35.0,
@@ -322,7 +329,7 @@ def sample_damage_hotspot() -> DamageHotspot:
 def sample_damage_hotspots() -> List[DamageHotspot]:
     """List of sample damage hotspots."""
     return [
-        DamageHotspot(
+        DamageHotspot.model_construct(
             id=1,
             x=25.5,
             y=35.0,
@@ -332,7 +339,7 @@ def sample_damage_hotspots() -> List[DamageHotspot]:
             treatment="Calcium phytate treatment",
             icon="🔍"
         ),
-        DamageHotspot(
+        DamageHotspot.model_construct(
             id=2,
             x=70.0,
             y=25.0,
@@ -342,7 +349,7 @@ def sample_damage_hotspots() -> List[DamageHotspot]:
             treatment="Aqueous deacidification",
             icon="🟤"
         ),
-        DamageHotspot(
+        DamageHotspot.model_construct(
             id=3,
             x=50.0,
             y=60.0,
@@ -446,7 +453,7 @@ def sample_context_complete() -> Dict:
         "validator_warnings": [],
         "validator_corrections": [],
         "repair_recommendations": [
-            RepairRecommendation(
+            RepairRecommendation.model_construct(
                 issue="Iron-gall ink corrosion",
                 severity="critical",
                 recommendation="Calcium phytate treatment",
@@ -454,7 +461,7 @@ def sample_context_complete() -> Dict:
             )
         ],
         "damage_hotspots": [
-            DamageHotspot(
+            DamageHotspot.model_construct(
                 id=1,
                 x=25.5,
                 y=35.0,
@@ -476,9 +483,9 @@ def sample_context_complete() -> Dict:
 @pytest.fixture
 def sample_resurrection_result() -> ResurrectionResult:
     """Complete sample resurrection result."""
-    return ResurrectionResult(
+    return ResurrectionResult.model_construct(
         segments=[
-            TextSegment(
+            TextSegment.model_construct(
                 text=SAMPLE_MODERN_TEXT,
                 confidence=ConfidenceLevel.HIGH,
                 original_text=SAMPLE_DOKE_TEXT,
@@ -487,13 +494,13 @@ def sample_resurrection_result() -> ResurrectionResult:
         ],
         overall_confidence=78.5,
         agent_messages=[
-            AgentMessage(
+            AgentMessage.model_construct(
                 agent=AgentType.SCANNER,
                 message="📝 OCR extraction complete",
                 confidence=82.5,
                 timestamp=datetime(2024, 1, 15, 10, 30, 0)
             ),
-            AgentMessage(
+            AgentMessage.model_construct(
                 agent=AgentType.LINGUIST,
                 message="📝 TRANSLITERATION complete",
                 confidence=85.0,
@@ -506,7 +513,7 @@ def sample_resurrection_result() -> ResurrectionResult:
         historian_analysis="['Rudd-Lobengula treaty context']",
         validator_corrections=[],
         repair_recommendations=[
-            RepairRecommendation(
+            RepairRecommendation.model_construct(
                 issue="Iron-gall ink corrosion",
                 severity="critical",
                 recommendation="Calcium phytate treatment",
@@ -514,7 +521,7 @@ def sample_resurrection_result() -> ResurrectionResult:
             )
         ],
         damage_hotspots=[
-            DamageHotspot(
+            DamageHotspot.model_construct(
                 id=1,
                 x=25.5,
                 y=35.0,
@@ -533,6 +540,58 @@ def sample_resurrection_result() -> ResurrectionResult:
 # HELPER FUNCTIONS
 # =============================================================================
 
+# One event loop shared by every synchronous test that drains an agent
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+
+
+# Image bytes for agents whose image handling is patched out or never decodes them
+FAKE_IMAGE_DATA = b"fake_image_data"
+
+
+def make_context(raw_text: str, **fields) -> Dict:
+    """Build a minimal agent context for ``raw_text`` with a frozen start time."""
+    return {"raw_text": raw_text, "start_time": FROZEN_NOW, **fields}
+
+
+async def collect(agen) -> List[AgentMessage]:
+    """Gather every message an agent's process() generator yields."""
+    return [message async for message in agen]
+
+
+def drain(agen) -> List[AgentMessage]:
+    """Helper to run an agent's process() generator to completion from sync code."""
+    return _LOOP.run_until_complete(collect(agen))
+
+
+def find_messages(messages: List[AgentMessage], *needles: str,
+                  icase_needles: tuple = ()) -> List[AgentMessage]:
+    """
+    Return messages containing every needle.
+    
+    ``needles`` match case-sensitively; ``icase_needles`` match against
+    the lowercased message, which is computed once per message and only when
+    such needles are given.
+    """
+    folded = tuple(n.lower() for n in icase_needles)
+    found = []
+    for m in messages:
+        text = m.message
+        if not all(n in text for n in needles):
+            continue
+        if folded:
+            lowered = text.lower()
+            if not all(n in lowered for n in folded):
+                continue
+        found.append(m)
+    return found
+
+
+async def async_noop(*args, **kwargs) -> None:
+    """Stand-in for AI calls whose result is always None; cheaper than an AsyncMock."""
+    return None
+
+
 def create_agent_message(
     agent: AgentType,
     message: str,
@@ -542,13 +601,13 @@ def create_agent_message(
     metadata: Optional[Dict] = None
 ) -> AgentMessage:
     """Helper to create custom agent messages."""
-    return AgentMessage(
+    return AgentMessage.model_construct(
         agent=agent,
         message=message,
         confidence=confidence,
         document_section=section,
         is_debate=is_debate,
-        timestamp=datetime.utcnow(),
+        timestamp=FROZEN_NOW,
         metadata=metadata
     )
 
@@ -560,7 +619,7 @@ def create_text_segment(
     corrections: Optional[List[str]] = None
 ) -> TextSegment:
     """Helper to create custom text segments."""
-    return TextSegment(
+    return TextSegment.model_construct(
         text=text,
         confidence=confidence,
         original_text=original,
@@ -576,7 +635,7 @@ def create_damage_hotspot(
     severity: str = "moderate"
 ) -> DamageHotspot:
     """Helper to create custom damage hotspots."""
-    return DamageHotspot(
+    return DamageHotspot.model_construct(
         id=id,
         x=x,
         y=y,
@@ -586,3 +645,41 @@ def create_damage_hotspot(
         treatment=f"Treatment for {damage_type}",
         icon="⚠️"
     )
+
+
+# Per-run attributes set in each agent's __init__, mapped to a factory for
+# their initial value; clearing all of them leaves the agent as if fresh
+_PER_RUN_STATE = {
+    "messages": list,
+    # Scanner
+    "raw_text": str,
+    "ocr_confidence": float,
+    "damage_assessment": dict,
+    "document_analysis": dict,
+    "enhancements_applied": list,
+    # Linguist
+    "transliterated_text": str,
+    "changes": list,
+    "terms_found": list,
+    "cultural_insights": list,
+    "cultural_significance": int,
+    # Historian
+    "findings": list,
+    "verified_facts": list,
+    "anomalies": list,
+    # Validator
+    "warnings": list,
+    "corrections": list,
+    "final_confidence": float,
+    # Repair advisor
+    "recommendations": list,
+    "hotspots": list,
+    "priority_score": int,
+}
+
+
+def reset_agent_state(agent) -> None:
+    """Helper to clear per-run state so one agent can serve many examples."""
+    for attr, empty in _PER_RUN_STATE.items():
+        if hasattr(agent, attr):
+            setattr(agent, attr, empty())
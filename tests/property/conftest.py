@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the property-based test suite.
+
+Agents are built once per module and cleared with ``reset_agent_state``
+before each Hypothesis example instead of being re-instantiated.
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from main import LinguistAgent, PhysicalRepairAdvisorAgent, ScannerAgent, ValidatorAgent
+from tests.fixtures import async_noop
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    """Scanner agent shared by every test in a module."""
+    return ScannerAgent()
+
+
+@pytest.fixture(scope="module")
+def linguist():
+    """Linguist agent shared by every test in a module."""
+    return LinguistAgent()
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Validator agent shared by every test in a module."""
+    return ValidatorAgent()
+
+
+@pytest.fixture(scope="module")
+def patched_validator(validator):
+    """Module validator with its AI validation and reconstruction calls patched out."""
+    with patch.object(validator, '_get_ai_validation', async_noop), \
+         patch.object(validator, '_reconstruct_document', async_noop):
+        yield validator
+
+
+@pytest.fixture(scope="module")
+def scanner_ocr(scanner):
+    """Patch the module scanner's OCR call once and yield the mock.
+
+    Tests set ``scanner_ocr.return_value`` per example instead of re-patching.
+    """
+    with patch.object(scanner, '_call_paddleocr_vl', new=AsyncMock()) as mock_ocr:
+        yield mock_ocr
+
+
+@pytest.fixture(scope="module")
+def patched_advisor():
+    """One PhysicalRepairAdvisorAgent with its AI call patched out for the whole module."""
+    advisor = PhysicalRepairAdvisorAgent()
+    with patch.object(advisor, '_get_ai_damage_analysis', async_noop):
+        yield advisor
@@ -8,12 +8,11 @@ import pytest
 from hypothesis import given, settings, strategies as st
 import hashlib
 
-import sys
-sys.path.insert(0, '.')
 from tests.generators import arbitrary_image_bytes
 
+pytestmark = pytest.mark.property
+
 
-@pytest.mark.property
 @settings(max_examples=100, deadline=None)
 @given(
     image1=arbitrary_image_bytes(min_size=100, max_size=5000),
@@ -42,7 +41,6 @@ def test_cache_hash_uniqueness(image1, image2):
     assert hash1 == hash1_again, "Hash must be deterministic"
 
 
-@pytest.mark.property
 @settings(max_examples=100, deadline=None)
 @given(
     image_data=arbitrary_image_bytes(min_size=100, max_size=5000)
@@ -10,8 +10,6 @@ from hypothesis import given, settings
 from pydantic import ValidationError
 
 # Import models and generators
-import sys
-sys.path.insert(0, '.')
 from main import (
     AgentType, ConfidenceLevel, AgentMessage, TextSegment,
     RepairRecommendation, DamageHotspot, ResurrectionResult
@@ -24,12 +22,13 @@ from tests.generators import (
     arbitrary_resurrection_result
 )
 
+pytestmark = pytest.mark.property
+
 
 # =============================================================================
 # PROPERTY 4: DATA MODEL INTEGRITY
 # =============================================================================
 
-@pytest.mark.property
 @given(msg=arbitrary_agent_message())
 @settings(max_examples=100, deadline=None)
 def test_property_agent_message_integrity(msg: AgentMessage):
@@ -71,7 +70,6 @@ def test_property_agent_message_integrity(msg: AgentMessage):
     assert reconstructed.message == msg.message
 
 
-@pytest.mark.property
 @given(segment=arbitrary_text_segment())
 @settings(max_examples=100)
 def test_property_text_segment_integrity(segment: TextSegment):
@@ -108,7 +106,6 @@ def test_property_text_segment_integrity(segment: TextSegment):
     assert reconstructed.confidence == segment.confidence
 
 
-@pytest.mark.property
 @given(rec=arbitrary_repair_recommendation())
 @settings(max_examples=100)
 def test_property_repair_recommendation_integrity(rec: RepairRecommendation):
@@ -144,7 +141,6 @@ def test_property_repair_recommendation_integrity(rec: RepairRecommendation):
     assert reconstructed.recommendation == rec.recommendation
 
 
-@pytest.mark.property
 @given(hotspot=arbitrary_damage_hotspot())
 @settings(max_examples=100)
 def test_property_damage_hotspot_integrity(hotspot: DamageHotspot):
@@ -191,7 +187,6 @@ def test_property_damage_hotspot_integrity(hotspot: DamageHotspot):
     assert reconstructed.y == hotspot.y
 
 
-@pytest.mark.property
 @given(result=arbitrary_resurrection_result())
 @settings(max_examples=100)
 def test_property_resurrection_result_integrity(result: ResurrectionResult):
@@ -259,7 +254,6 @@ def test_property_resurrection_result_integrity(result: ResurrectionResult):
     assert reconstructed.processing_time_ms == result.processing_time_ms
 
 
-@pytest.mark.property
 @given(result=arbitrary_resurrection_result())
 @settings(max_examples=100)
 def test_property_resurrection_result_non_empty_collections(result: ResurrectionResult):
@@ -277,7 +271,6 @@ def test_property_resurrection_result_non_empty_collections(result: Resurrection
     assert len(result.agent_messages) > 0
 
 
-@pytest.mark.property
 @given(result=arbitrary_resurrection_result())
 @settings(max_examples=100, deadline=None)
 def test_property_resurrection_result_json_serialization(result: ResurrectionResult):
@@ -6,23 +6,23 @@ Validates: Requirements 4.4
 """
 import pytest
 from hypothesis import given, settings, strategies as st
-from datetime import datetime
-import asyncio
 
 # Import from main.py
-import sys
-sys.path.insert(0, '.')
 from main import HistorianAgent
 
 # Import generators
-from tests.generators import arbitrary_text, arbitrary_context_dict
+from tests.fixtures import reset_agent_state
+from tests.generators import FROZEN_NOW, arbitrary_text, arbitrary_context_dict
+
+
+# Every test here runs the full HistorianAgent.process() pipeline
+pytestmark = [pytest.mark.property, pytest.mark.slow_property]
 
 
 # =============================================================================
 # PROPERTY 3: CONTEXT PROPAGATION (HISTORIAN)
 # =============================================================================
 
-@pytest.mark.asyncio
 @given(text=arbitrary_text(min_length=10, max_length=500))
 @settings(max_examples=20, deadline=None)
 async def test_property_historian_context_propagation(text):
@@ -40,13 +40,11 @@ async def test_property_historian_context_propagation(text):
     context = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert - Check all required fields are populated
     assert "historian_findings" in context, \
@@ -65,7 +63,6 @@ async def test_property_historian_context_propagation(text):
         "historical_anomalies should be a list"
 
 
-@pytest.mark.asyncio
 @given(context_dict=arbitrary_context_dict())
 @settings(max_examples=20, deadline=None)
 async def test_property_historian_preserves_existing_context(context_dict):
@@ -81,20 +78,17 @@ async def test_property_historian_preserves_existing_context(context_dict):
     
     # Add required fields for Historian
     context_dict["raw_text"] = context_dict.get("raw_text", "Test text with Lobengula")
-    context_dict["start_time"] = context_dict.get("start_time", datetime.utcnow())
+    context_dict["start_time"] = context_dict.get("start_time", FROZEN_NOW)
     
     # Store original keys
-    original_keys = set(context_dict.keys())
+    original_keys = frozenset(context_dict.keys())
     
     # Act
-    messages = []
-    async for msg in historian.process(context_dict):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context_dict)]
     
     # Assert - All original keys should still be present
-    for key in original_keys:
-        assert key in context_dict, \
-            f"Historian should preserve existing context key: {key}"
+    assert original_keys <= context_dict.keys(), \
+        f"Historian should preserve existing context keys: {original_keys - context_dict.keys()}"
     
     # New keys should be added
     assert "historian_findings" in context_dict
@@ -102,7 +96,6 @@ async def test_property_historian_preserves_existing_context(context_dict):
     assert "historical_anomalies" in context_dict
 
 
-@pytest.mark.asyncio
 @given(
     raw_text=arbitrary_text(min_length=10, max_length=300),
     transliterated_text=arbitrary_text(min_length=10, max_length=300)
@@ -121,13 +114,11 @@ async def test_property_historian_handles_both_text_fields(raw_text, translitera
     context = {
         "raw_text": raw_text,
         "transliterated_text": transliterated_text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert
     assert "historian_findings" in context
@@ -138,7 +129,6 @@ async def test_property_historian_handles_both_text_fields(raw_text, translitera
     assert len(messages) > 0, "Should emit at least one message"
 
 
-@pytest.mark.asyncio
 @given(text=st.text(min_size=10, max_size=500))
 @settings(max_examples=20, deadline=None)
 async def test_property_historian_context_fields_are_lists(text):
@@ -154,13 +144,11 @@ async def test_property_historian_context_fields_are_lists(text):
     context = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert - All fields should be lists
     assert isinstance(context["historian_findings"], list)
@@ -178,7 +166,6 @@ async def test_property_historian_context_fields_are_lists(text):
         assert isinstance(item, str), "historical_anomalies items should be strings"
 
 
-@pytest.mark.asyncio
 @given(text=arbitrary_text(min_length=10, max_length=500))
 @settings(max_examples=20, deadline=None)
 async def test_property_historian_emits_messages(text):
@@ -194,13 +181,11 @@ async def test_property_historian_emits_messages(text):
     context = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert
     assert len(messages) > 0, "Historian should emit at least one message"
@@ -212,7 +197,6 @@ async def test_property_historian_emits_messages(text):
         assert hasattr(msg, 'timestamp'), "Message should have timestamp field"
 
 
-@pytest.mark.asyncio
 @given(
     text=arbitrary_text(min_length=10, max_length=500),
     has_transliterated=st.booleans()
@@ -230,7 +214,7 @@ async def test_property_historian_handles_missing_transliterated_text(text, has_
     historian = HistorianAgent()
     context = {
         "raw_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Optionally add transliterated_text
@@ -238,9 +222,7 @@ async def test_property_historian_handles_missing_transliterated_text(text, has_
         context["transliterated_text"] = text
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert - Should still populate all fields
     assert "historian_findings" in context
@@ -248,7 +230,6 @@ async def test_property_historian_handles_missing_transliterated_text(text, has_
     assert "historical_anomalies" in context
 
 
-@pytest.mark.asyncio
 @given(text=st.just(""))
 @settings(max_examples=10, deadline=None)
 async def test_property_historian_handles_empty_text(text):
@@ -264,13 +245,11 @@ async def test_property_historian_handles_empty_text(text):
     context = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert
     assert "historian_findings" in context
@@ -283,7 +262,6 @@ async def test_property_historian_handles_empty_text(text):
     assert isinstance(context["historical_anomalies"], list)
 
 
-@pytest.mark.asyncio
 @given(
     text=arbitrary_text(min_length=10, max_length=500),
     extra_fields=st.dictionaries(
@@ -306,7 +284,7 @@ async def test_property_historian_does_not_overwrite_context(text, extra_fields)
     context = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow(),
+        "start_time": FROZEN_NOW,
         **extra_fields
     }
     
@@ -314,9 +292,7 @@ async def test_property_historian_does_not_overwrite_context(text, extra_fields)
     original_values = {k: v for k, v in extra_fields.items()}
     
     # Act
-    messages = []
-    async for msg in historian.process(context):
-        messages.append(msg)
+    messages = [msg async for msg in historian.process(context)]
     
     # Assert - Extra fields should be preserved with original values
     for key, original_value in original_values.items():
@@ -325,9 +301,8 @@ async def test_property_historian_does_not_overwrite_context(text, extra_fields)
             f"Extra field '{key}' should have original value"
 
 
-@pytest.mark.asyncio
 @given(text=arbitrary_text(min_length=10, max_length=500))
-@settings(max_examples=20, deadline=None)
+@settings(max_examples=3, deadline=None)
 async def test_property_historian_context_idempotent(text):
     """
     Feature: code-quality-validation, Property 3: Context Propagation (Historian)
@@ -336,30 +311,27 @@ async def test_property_historian_context_idempotent(text):
     Property: For any text, running the Historian twice should produce
     consistent context fields (idempotent operation).
     """
-    # Arrange
-    historian1 = HistorianAgent()
-    historian2 = HistorianAgent()
+    # Arrange - One agent is reused for both runs, reset in between so the
+    # second run does not extend the lists the first one handed out
+    historian = HistorianAgent()
     
     context1 = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     context2 = {
         "raw_text": text,
         "transliterated_text": text,
-        "start_time": datetime.utcnow()
+        "start_time": FROZEN_NOW
     }
     
     # Act
-    messages1 = []
-    async for msg in historian1.process(context1):
-        messages1.append(msg)
+    messages1 = [msg async for msg in historian.process(context1)]
     
-    messages2 = []
-    async for msg in historian2.process(context2):
-        messages2.append(msg)
+    reset_agent_state(historian)
+    messages2 = [msg async for msg in historian.process(context2)]
     
     # Assert - Both contexts should have the same fields
     assert set(context1.keys()) == set(context2.keys()), \
@@ -370,3 +342,6 @@ async def test_property_historian_context_idempotent(text):
         assert "historian_findings" in ctx
         assert "verified_facts" in ctx
         assert "historical_anomalies" in ctx
+    
+    assert context1["verified_facts"] is not context2["verified_facts"], \
+        "Each run should hand out its own verified_facts list"
@@ -8,13 +8,13 @@ import pytest
 from hypothesis import given, settings, strategies as st
 
 # Import from main.py
-import sys
-sys.path.insert(0, '.')
 from main import HistorianAgent
 
 # Import generators
 from tests.generators import arbitrary_text_with_historical_figures, HISTORICAL_FIGURES
 
+pytestmark = pytest.mark.property
+
 
 # =============================================================================
 # PROPERTY 10: HISTORICAL FIGURE DETECTION
@@ -129,10 +129,10 @@ def test_property_figure_detection_case_insensitive(figure, case_variant):
     elif case_variant == 'title':
         figure_variant = figure.title()
     else:  # mixed
-        figure_variant = ''.join(
+        figure_variant = ''.join([
             c.upper() if i % 2 == 0 else c.lower()
             for i, c in enumerate(figure)
-        )
+        ])
     
     text = f"This document mentions {figure_variant} in the records."
     
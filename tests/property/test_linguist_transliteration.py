@@ -5,14 +5,21 @@ Feature: code-quality-validation, Property 5: Transliteration Consistency
 Validates: Requirements 3.1, 3.2
 """
 import pytest
+from collections import Counter
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 # Import from main.py and generators
-import sys
-sys.path.insert(0, '.')
-from main import LinguistAgent
-from tests.generators import arbitrary_text_with_doke
+from main import TRANSLITERATION_MAP
+from tests.generators import FAST_PHASES, arbitrary_text, arbitrary_text_with_doke
+
+pytestmark = pytest.mark.property
+
+_DOKE_KEYSET = frozenset(TRANSLITERATION_MAP)
+
+# Replacements never reintroduce Doke characters, which makes
+# transliteration idempotent by construction
+assert _DOKE_KEYSET.isdisjoint(''.join(TRANSLITERATION_MAP.values()))
 
 
 # =============================================================================
@@ -20,8 +27,8 @@ from tests.generators import arbitrary_text_with_doke
 # =============================================================================
 
 @given(text=arbitrary_text_with_doke(min_doke=1, max_doke=10))
-@settings(max_examples=100)
-def test_property_transliteration_consistency(text):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_transliteration_consistency(linguist, text):
     """
     Feature: code-quality-validation, Property 5: Transliteration Consistency
     Validates: Requirements 3.1, 3.2
@@ -30,43 +37,42 @@ def test_property_transliteration_consistency(text):
     applying the Linguist's transliteration should replace all Doke characters with their
     modern equivalents according to the TRANSLITERATION_MAP.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Act
     result, changes = linguist._transliterate(text)
     
     # Assert: All Doke characters should be replaced
-    for doke_char in linguist.TRANSLITERATION_MAP.keys():
-        assert doke_char not in result, \
-            f"Doke character '{doke_char}' should be replaced in result"
+    assert _DOKE_KEYSET.isdisjoint(result), \
+        f"Doke characters should be replaced in result: {sorted(_DOKE_KEYSET.intersection(result))}"
     
     # Assert: Number of changes should match number of Doke characters in original text
-    doke_count = sum(text.count(char) for char in linguist.TRANSLITERATION_MAP.keys())
-    assert len(changes) == len(set([char for char in linguist.TRANSLITERATION_MAP.keys() if char in text])), \
+    cnt = Counter(text)
+    doke_count = sum(cnt.get(c, 0) for c in _DOKE_KEYSET)
+    expected_unique = frozenset(cnt) & _DOKE_KEYSET
+    assert len(changes) == len(expected_unique), \
         f"Should record one change entry per unique Doke character type found"
     
     # Assert: Each change should be valid
     for orig, modern, reason in changes:
-        assert orig in linguist.TRANSLITERATION_MAP, \
+        assert orig in TRANSLITERATION_MAP, \
             f"Original character '{orig}' should be in TRANSLITERATION_MAP"
-        assert linguist.TRANSLITERATION_MAP[orig] == modern, \
+        assert TRANSLITERATION_MAP[orig] == modern, \
             f"Modern equivalent should match TRANSLITERATION_MAP: {orig} -> {modern}"
         assert isinstance(reason, str) and len(reason) > 0, \
             "Reason should be a non-empty string"
 
 
 @given(text=arbitrary_text_with_doke(min_doke=1, max_doke=5))
-@settings(max_examples=100)
-def test_property_transliteration_idempotence(text):
+@settings(max_examples=25, phases=FAST_PHASES)
+def test_property_transliteration_idempotence(linguist, text):
     """
     Property: Transliterating text twice should produce the same result as transliterating once.
     
     This tests idempotence: transliterate(transliterate(x)) == transliterate(x)
-    """
-    # Arrange
-    linguist = LinguistAgent()
     
+    Idempotence follows from the output alphabet of TRANSLITERATION_MAP
+    sharing no characters with its keys (asserted at import time), so a
+    small example budget is enough to guard the implementation.
+    """
     # Act
     result1, changes1 = linguist._transliterate(text)
     result2, changes2 = linguist._transliterate(result1)
@@ -77,17 +83,14 @@ def test_property_transliteration_idempotence(text):
 
 
 @given(text=st.text(min_size=10, max_size=200))
-@settings(max_examples=100)
-def test_property_transliteration_preserves_non_doke_text(text):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_transliteration_preserves_non_doke_text(linguist, text):
     """
     Property: For any text without Doke characters, transliteration should not change the text.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Remove any Doke characters that might have been randomly generated
     clean_text = text
-    for doke_char in linguist.TRANSLITERATION_MAP.keys():
+    for doke_char in TRANSLITERATION_MAP.keys():
         clean_text = clean_text.replace(doke_char, '')
     
     # Act
@@ -99,17 +102,14 @@ def test_property_transliteration_preserves_non_doke_text(text):
 
 
 @given(text=arbitrary_text_with_doke(min_doke=1, max_doke=10))
-@settings(max_examples=100)
-def test_property_transliteration_length_bounded(text):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_transliteration_length_bounded(linguist, text):
     """
     Property: Transliteration should not drastically change text length.
     
     Since most Doke characters map to 1-2 characters, the result should be
     at most 2x the original length.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Act
     result, changes = linguist._transliterate(text)
     
@@ -121,59 +121,51 @@ def test_property_transliteration_length_bounded(text):
 
 
 @given(text=arbitrary_text_with_doke(min_doke=1, max_doke=10))
-@settings(max_examples=100)
-def test_property_transliteration_produces_valid_mappings(text):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_transliteration_produces_valid_mappings(linguist, text):
     """
     Property: Every Doke character in the original text should have a corresponding
     modern equivalent in the result according to TRANSLITERATION_MAP.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Count Doke characters in original
-    doke_chars_in_text = {}
-    for doke_char in linguist.TRANSLITERATION_MAP.keys():
-        count = text.count(doke_char)
-        if count > 0:
-            doke_chars_in_text[doke_char] = count
+    cnt = Counter(text)
+    doke_chars_in_text = {c: cnt[c] for c in _DOKE_KEYSET if cnt[c] > 0}
     
     # Act
     result, changes = linguist._transliterate(text)
     
     # Assert: For each Doke character found, verify its replacement appears
     for doke_char, count in doke_chars_in_text.items():
-        modern_equiv = linguist.TRANSLITERATION_MAP[doke_char]
+        modern_equiv = TRANSLITERATION_MAP[doke_char]
         # The modern equivalent should appear at least as many times as the Doke char was replaced
         # (it might appear more if it was already in the text)
         assert modern_equiv in result or count == 0, \
             f"Modern equivalent '{modern_equiv}' for '{doke_char}' should appear in result"
 
 
-@given(
-    text=arbitrary_text_with_doke(min_doke=1, max_doke=5),
-    iterations=st.integers(min_value=1, max_value=5)
-)
-@settings(max_examples=100)
-def test_property_transliteration_multiple_applications(text, iterations):
+@given(text=arbitrary_text(min_length=10, max_length=300))
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_transliteration_output_structure(linguist, text):
     """
-    Property: Applying transliteration multiple times should be equivalent to applying it once.
-    
-    This is a stronger form of idempotence testing.
+    Property: For any text, _transliterate should return a string (never None)
+    and a list of well-formed (orig, modern, reason) change tuples.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
-    # Act: Apply transliteration once
-    result_once, _ = linguist._transliterate(text)
+    # Act
+    result, changes = linguist._transliterate(text)
     
-    # Act: Apply transliteration multiple times
-    result_multiple = text
-    for _ in range(iterations):
-        result_multiple, _ = linguist._transliterate(result_multiple)
+    # Assert: Result should never be None
+    assert result is not None, "Transliterated text should never be None"
+    assert isinstance(result, str), "Transliterated text should always be a string"
     
-    # Assert: Results should be identical
-    assert result_once == result_multiple, \
-        f"Applying transliteration {iterations} times should equal applying it once"
+    # Assert: Change entries should be valid change tuples
+    assert isinstance(changes, list), "Changes should be a list"
+    for change in changes:
+        assert isinstance(change, tuple), "Each change should be a tuple"
+        assert len(change) == 3, "Each change should have exactly 3 elements"
+        orig, modern, reason = change
+        assert len(orig) > 0, "Original character should not be empty"
+        assert len(modern) > 0, "Modern equivalent should not be empty"
+        assert len(reason) > 0, "Reason should not be empty"
 
 
 # =============================================================================
@@ -181,13 +173,12 @@ def test_property_transliteration_multiple_applications(text, iterations):
 # =============================================================================
 
 @given(doke_char=st.sampled_from(['ɓ', 'ɗ', 'ȿ', 'ɀ', 'ŋ', 'ʃ', 'ʒ', 'ṱ', 'ḓ', 'ḽ', 'ṋ']))
-@settings(max_examples=100)
-def test_property_single_doke_character_transliteration(doke_char):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_single_doke_character_transliteration(linguist, doke_char):
     """
     Property: Each individual Doke character should be correctly transliterated.
     """
     # Arrange
-    linguist = LinguistAgent()
     text = f"test {doke_char} test"
     
     # Act
@@ -199,19 +190,16 @@ def test_property_single_doke_character_transliteration(doke_char):
     assert changes[0][0] == doke_char, "Change should be for the correct character"
     
     # Verify the replacement is correct
-    expected_modern = linguist.TRANSLITERATION_MAP[doke_char]
+    expected_modern = TRANSLITERATION_MAP[doke_char]
     assert expected_modern in result, f"Modern equivalent '{expected_modern}' should be in result"
 
 
 @given(text=st.just(''))
-@settings(max_examples=10)
-def test_property_empty_text_transliteration(text):
+@settings(max_examples=10, phases=FAST_PHASES)
+def test_property_empty_text_transliteration(linguist, text):
     """
     Property: Transliterating empty text should return empty text with no changes.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Act
     result, changes = linguist._transliterate(text)
     
@@ -221,20 +209,16 @@ def test_property_empty_text_transliteration(text):
 
 
 @given(text=st.text(alphabet=st.sampled_from(['ɓ', 'ɗ', 'ȿ', 'ɀ']), min_size=1, max_size=50))
-@settings(max_examples=100)
-def test_property_only_doke_characters(text):
+@settings(max_examples=100, phases=FAST_PHASES)
+def test_property_only_doke_characters(linguist, text):
     """
     Property: Text containing only Doke characters should be fully transliterated.
     """
-    # Arrange
-    linguist = LinguistAgent()
-    
     # Act
     result, changes = linguist._transliterate(text)
     
     # Assert: No Doke characters should remain
-    for doke_char in linguist.TRANSLITERATION_MAP.keys():
-        assert doke_char not in result, f"Doke character '{doke_char}' should be removed"
+    assert _DOKE_KEYSET.isdisjoint(result), "Doke characters should be removed"
     
     # Assert: Result should not be empty (unless all Doke chars map to empty, which they don't)
     assert len(result) > 0, "Result should not be empty"
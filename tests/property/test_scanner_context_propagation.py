@@ -10,25 +10,29 @@ all fields that agent is responsible for populating.
 For Scanner: raw_text and ocr_confidence must be populated after successful processing.
 """
 import pytest
-from hypothesis import given, settings, strategies as st
-from unittest.mock import AsyncMock, patch
-from datetime import datetime
+from hypothesis import given, example, settings, strategies as st
 
-import sys
-sys.path.insert(0, '.')
-from main import ScannerAgent
-from tests.generators import arbitrary_text, arbitrary_confidence, arbitrary_image_bytes
+from main import AgentType, ScannerAgent
+from tests.generators import FROZEN_NOW, arbitrary_text, cheap_text, arbitrary_confidence
+from tests.fixtures import drain, reset_agent_state
 
+pytestmark = pytest.mark.property
 
-@pytest.mark.property
-@pytest.mark.asyncio
-@settings(max_examples=100, deadline=None)
+# OCR is mocked and never reads the bytes, so one JPEG-headed buffer serves every example
+_IMG = b'\xff\xd8\xff\xe0' + b'\x00' * 1020
+
+_DOKE = frozenset(ScannerAgent.DOKE_CHARACTERS)
+
+
+@settings(max_examples=20, deadline=None)
 @given(
-    image_data=arbitrary_image_bytes(min_size=100, max_size=5000),
-    ocr_text=arbitrary_text(min_length=10, max_length=500),
+    ocr_text=cheap_text(min_length=10, max_length=500),
     ocr_conf=arbitrary_confidence()
 )
-async def test_scanner_context_propagation(image_data, ocr_text, ocr_conf):
+@example(ocr_text="x" * 10, ocr_conf=0.0)
+@example(ocr_text="x" * 10, ocr_conf=50.0)
+@example(ocr_text="x" * 10, ocr_conf=100.0)
+def test_scanner_context_propagation(scanner, scanner_ocr, ocr_text, ocr_conf):
     """
     Feature: code-quality-validation, Property 3: Context Propagation (Scanner)
     Validates: Requirements 2.2, 2.3, 2.6
@@ -36,53 +40,43 @@ async def test_scanner_context_propagation(image_data, ocr_text, ocr_conf):
     Property: For any successful Scanner execution, the context must contain
     'raw_text' and 'ocr_confidence' fields populated by the Scanner.
     """
-    scanner = ScannerAgent()
+    reset_agent_state(scanner)
     context = {
-        "image_data": image_data,
-        "start_time": datetime.utcnow()
+        "image_data": _IMG,
+        "start_time": FROZEN_NOW
     }
     
-    # Mock the PaddleOCR-VL API call to return success
-    with patch.object(scanner, '_call_paddleocr_vl', new_callable=AsyncMock) as mock_ocr:
-        mock_ocr.return_value = {
-            "success": True,
-            "text": ocr_text,
-            "confidence": ocr_conf
-        }
-        
-        # Process the document
-        messages = []
-        async for message in scanner.process(context):
-            messages.append(message)
-        
-        # PROPERTY: Scanner must populate raw_text in context
-        assert "raw_text" in context, "Scanner must populate 'raw_text' in context"
-        
-        # PROPERTY: Scanner must populate ocr_confidence in context
-        assert "ocr_confidence" in context, "Scanner must populate 'ocr_confidence' in context"
-        
-        # PROPERTY: raw_text must match the OCR result
-        assert context["raw_text"] == ocr_text, "raw_text must match OCR output"
-        
-        # PROPERTY: ocr_confidence must match the OCR result
-        assert context["ocr_confidence"] == ocr_conf, "ocr_confidence must match OCR output"
-        
-        # PROPERTY: Scanner must emit at least one message
-        assert len(messages) > 0, "Scanner must emit at least one message"
-        
-        # PROPERTY: All messages must be from Scanner agent
-        from main import AgentType
-        for msg in messages:
-            assert msg.agent == AgentType.SCANNER, "All messages must be from Scanner agent"
+    # OCR result returned by the module-patched PaddleOCR-VL call
+    scanner_ocr.return_value = {
+        "success": True,
+        "text": ocr_text,
+        "confidence": ocr_conf
+    }
+    
+    # Process the document
+    messages = drain(scanner.process(context))
+    
+    # PROPERTY: Scanner must populate raw_text in context
+    assert "raw_text" in context, "Scanner must populate 'raw_text' in context"
+    
+    # PROPERTY: Scanner must populate ocr_confidence in context
+    assert "ocr_confidence" in context, "Scanner must populate 'ocr_confidence' in context"
+    
+    # PROPERTY: raw_text must match the OCR result
+    assert context["raw_text"] == ocr_text, "raw_text must match OCR output"
+    
+    # PROPERTY: ocr_confidence must match the OCR result
+    assert context["ocr_confidence"] == ocr_conf, "ocr_confidence must match OCR output"
+    
+    # PROPERTY: Scanner must emit at least one message
+    assert len(messages) > 0, "Scanner must emit at least one message"
+    
+    # PROPERTY: All messages must be from Scanner agent
+    for msg in messages:
+        assert msg.agent == AgentType.SCANNER, "All messages must be from Scanner agent"
 
 
-@pytest.mark.property
-@pytest.mark.asyncio
-@settings(max_examples=100, deadline=None)
-@given(
-    image_data=arbitrary_image_bytes(min_size=100, max_size=5000)
-)
-async def test_scanner_context_propagation_on_failure(image_data):
+def test_scanner_context_propagation_on_failure(scanner, scanner_ocr):
     """
     Feature: code-quality-validation, Property 3: Context Propagation (Scanner)
     Validates: Requirements 2.5, 11.2
@@ -90,42 +84,34 @@ async def test_scanner_context_propagation_on_failure(image_data):
     Property: When Scanner fails, it should raise an exception and context
     should have empty/zero values for raw_text and ocr_confidence.
     """
-    scanner = ScannerAgent()
+    reset_agent_state(scanner)
     context = {
-        "image_data": image_data,
-        "start_time": datetime.utcnow()
+        "image_data": _IMG,
+        "start_time": FROZEN_NOW
+    }
+    
+    # OCR failure returned by the module-patched PaddleOCR-VL call
+    scanner_ocr.return_value = {
+        "success": False,
+        "text": "",
+        "confidence": 0
     }
     
-    # Mock the PaddleOCR-VL API call to return failure
-    with patch.object(scanner, '_call_paddleocr_vl', new_callable=AsyncMock) as mock_ocr:
-        mock_ocr.return_value = {
-            "success": False,
-            "text": "",
-            "confidence": 0
-        }
-        
-        # Scanner should raise an exception on failure
-        with pytest.raises(Exception) as exc_info:
-            messages = []
-            async for message in scanner.process(context):
-                messages.append(message)
-        
-        # PROPERTY: Exception message must be clear
-        assert "PaddleOCR-VL API failed" in str(exc_info.value)
-        
-        # PROPERTY: Context should have empty/zero values
-        assert context.get("raw_text", "") == ""
-        assert context.get("ocr_confidence", 0) == 0
+    # PROPERTY: Scanner raises a clear RuntimeError on failure
+    with pytest.raises(RuntimeError, match="PaddleOCR-VL API failed"):
+        drain(scanner.process(context))
+    
+    # PROPERTY: Context should have empty/zero values
+    assert context.get("raw_text", "") == ""
+    assert context.get("ocr_confidence", 0) == 0
 
 
-@pytest.mark.property
-@pytest.mark.asyncio
 @settings(max_examples=50, deadline=None)
 @given(
     ocr_text=arbitrary_text(min_length=50, max_length=300, include_doke=True),
     ocr_conf=arbitrary_confidence()
 )
-async def test_scanner_doke_detection_in_context(ocr_text, ocr_conf):
+def test_scanner_doke_detection_in_context(scanner, scanner_ocr, ocr_text, ocr_conf):
     """
     Feature: code-quality-validation, Property 3: Context Propagation (Scanner)
     Validates: Requirements 2.4
@@ -133,43 +119,39 @@ async def test_scanner_doke_detection_in_context(ocr_text, ocr_conf):
     Property: When Scanner detects Doke characters, it should emit a message
     with metadata containing the detected characters.
     """
-    scanner = ScannerAgent()
+    reset_agent_state(scanner)
     context = {
-        "image_data": b"fake_image_data",
-        "start_time": datetime.utcnow()
+        "image_data": _IMG,
+        "start_time": FROZEN_NOW
     }
     
     # Check if text actually contains Doke characters
-    doke_chars = ['ɓ', 'ɗ', 'ȿ', 'ɀ', 'ŋ', 'ʃ', 'ʒ', 'ṱ', 'ḓ', 'ḽ', 'ṋ']
-    has_doke = any(char in ocr_text for char in doke_chars)
-    
-    # Mock the PaddleOCR-VL API call
-    with patch.object(scanner, '_call_paddleocr_vl', new_callable=AsyncMock) as mock_ocr:
-        mock_ocr.return_value = {
-            "success": True,
-            "text": ocr_text,
-            "confidence": ocr_conf
-        }
-        
-        # Process the document
-        messages = []
-        async for message in scanner.process(context):
-            messages.append(message)
-        
-        # PROPERTY: Context must be populated
-        assert "raw_text" in context
-        assert "ocr_confidence" in context
-        
-        # PROPERTY: If text has Doke characters, a detection message must be emitted
-        doke_messages = [m for m in messages if "DOKE ORTHOGRAPHY DETECTED" in m.message]
-        
-        if has_doke:
-            assert len(doke_messages) > 0, "Doke detection message must be emitted when Doke chars present"
-            # Verify metadata contains detected characters
-            doke_msg = doke_messages[0]
-            assert doke_msg.metadata is not None
-            assert "doke_chars" in doke_msg.metadata
-        else:
-            # If no Doke characters, should emit standard script message
-            standard_messages = [m for m in messages if "Standard Latin script" in m.message]
-            assert len(standard_messages) > 0, "Standard script message must be emitted when no Doke chars"
+    has_doke = not _DOKE.isdisjoint(ocr_text)
+    
+    # OCR result returned by the module-patched PaddleOCR-VL call
+    scanner_ocr.return_value = {
+        "success": True,
+        "text": ocr_text,
+        "confidence": ocr_conf
+    }
+    
+    # Process the document
+    messages = drain(scanner.process(context))
+    
+    # PROPERTY: Context must be populated
+    assert "raw_text" in context
+    assert "ocr_confidence" in context
+    
+    # PROPERTY: If text has Doke characters, a detection message must be emitted
+    doke_messages = [m for m in messages if "DOKE ORTHOGRAPHY DETECTED" in m.message]
+    
+    if has_doke:
+        assert len(doke_messages) > 0, "Doke detection message must be emitted when Doke chars present"
+        # Verify metadata contains detected characters
+        doke_msg = doke_messages[0]
+        assert doke_msg.metadata is not None
+        assert "doke_chars" in doke_msg.metadata
+    else:
+        # If no Doke characters, should emit standard script message
+        standard_messages = [m for m in messages if "Standard Latin script" in m.message]
+        assert len(standard_messages) > 0, "Standard script message must be emitted when no Doke chars"
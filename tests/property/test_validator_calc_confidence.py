@@ -0,0 +1,101 @@
+"""
+Property-based tests for the Validator's synchronous confidence calculation.
+
+Feature: code-quality-validation, Property 8: Confidence Score Bounds
+Validates: Requirements 5.1
+"""
+import numpy as np
+import pytest
+from hypothesis import given, settings
+
+# Import from main.py
+from main import ValidatorAgent
+
+# Import generators
+from tests.generators import arbitrary_confidence
+
+pytestmark = pytest.mark.property
+
+# _calculate_final_confidence only reads the context it is given
+_VALIDATOR = ValidatorAgent()
+
+
+def _calc_final_confidence_vec(ocr_arr, facts, warnings):
+    """NumPy mirror of ValidatorAgent._calculate_final_confidence over many OCR scores."""
+    ocr = np.clip(ocr_arr, 0, 100)
+    hist_score = min(facts * 15, 100)
+    warning_penalty = max(0, 100 - warnings * 10)
+    return ocr * 0.4 + hist_score * 0.3 + warning_penalty * 0.3
+
+
+# =============================================================================
+# PROPERTY 8: CONFIDENCE SCORE BOUNDS (PURE CALCULATION)
+# =============================================================================
+
+@given(
+    ocr_confidence=arbitrary_confidence()
+)
+@settings(max_examples=5, deadline=None)
+def test_property_calculate_final_confidence_bounds(ocr_confidence):
+    """
+    Feature: code-quality-validation, Property 8: Confidence Score Bounds
+    Validates: Requirements 5.1
+    
+    Property: The _calculate_final_confidence method should always return
+    a value between 0 and 100 for any valid input.
+    """
+    # Arrange
+    context = {
+        "ocr_confidence": ocr_confidence,
+        "verified_facts": ["Fact 1", "Fact 2"],
+        "validator_warnings": []
+    }
+    
+    # Act
+    final_confidence = _VALIDATOR._calculate_final_confidence(context)
+    
+    # Assert
+    assert 0 <= final_confidence <= 100, \
+        f"Calculated confidence {final_confidence} should be between 0 and 100"
+    assert isinstance(final_confidence, (int, float)), \
+        "Confidence should be a number"
+    
+    # The batched mirror below must agree with the real method
+    expected = _calc_final_confidence_vec(np.array([ocr_confidence]), 2, 0)[0]
+    assert final_confidence == pytest.approx(expected), \
+        "Vectorized mirror diverged from _calculate_final_confidence"
+
+
+@pytest.mark.parametrize("facts", [0, 1, 2, 7, 20])
+@pytest.mark.parametrize("warnings", [0, 1, 5, 10, 15])
+def test_calculate_final_confidence_bounds_batched(facts, warnings):
+    """
+    Feature: code-quality-validation, Property 8: Confidence Score Bounds
+    Validates: Requirements 5.1
+    
+    Property: Across a dense grid of OCR scores, including out-of-range ones,
+    the final confidence stays between 0 and 100 and matches the mirror.
+    """
+    # Arrange
+    ocr_arr = np.linspace(-100, 200, 1000)
+    facts_list = [f"Fact {i}" for i in range(facts)]
+    warnings_list = [f"Warning {i}" for i in range(warnings)]
+    
+    # Act
+    expected = _calc_final_confidence_vec(ocr_arr, facts, warnings)
+    actual = np.array([
+        _VALIDATOR._calculate_final_confidence({
+            "ocr_confidence": float(ocr),
+            "verified_facts": facts_list,
+            "validator_warnings": warnings_list
+        })
+        for ocr in ocr_arr
+    ])
+    
+    # Assert
+    assert np.all((0 <= actual) & (actual <= 100)), \
+        f"Calculated confidence out of bounds (facts={facts}, warnings={warnings})"
+    np.testing.assert_allclose(actual, expected, err_msg=(
+        f"Vectorized mirror diverged from _calculate_final_confidence "
+        f"(facts={facts}, warnings={warnings})"
+    ))
@@ -4,30 +4,76 @@ Property-based tests for Validator inconsistency detection.
 Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
 Validates: Requirements 5.3
 """
+import functools
 import pytest
-from datetime import datetime
 from hypothesis import given, strategies as st, settings
 
-# Import from main.py
-import sys
-sys.path.insert(0, '.')
-from main import ValidatorAgent
+# Import test helpers
+from tests.fixtures import drain, reset_agent_state
+from tests.generators import FROZEN_NOW
 
-# Import generators
-from tests.generators import arbitrary_text
+pytestmark = pytest.mark.property
+
+
+# Fields every example shares; tests overlay only the two texts
+_BASE_CTX = {
+    "ocr_confidence": 75.0,
+    "verified_facts": (),
+    "historical_anomalies": (),
+    "start_time": FROZEN_NOW
+}
+
+def _text_of_length(min_length, max_length):
+    """Only lengths matter to these properties, so draw a length and repeat one character."""
+    return st.integers(min_value=min_length, max_value=max_length).map(lambda n: "a" * n)
+
+
+@st.composite
+def _pair_over_threshold(draw):
+    """Draw (raw, transliterated) lengths guaranteed to differ by more than 30%."""
+    raw = draw(st.integers(min_value=10, max_value=100))
+    return raw, draw(st.integers(min_value=int(raw * 1.31) + 1, max_value=raw * 10))
+
+
+@st.composite
+def _pair_within_threshold(draw):
+    """Draw (raw, transliterated) lengths 5-29% apart, clear of the 30% boundary."""
+    raw = draw(st.integers(min_value=100, max_value=200))
+    return raw, draw(st.integers(min_value=raw + raw // 20, max_value=int(raw * 1.29)))
+
+
+@pytest.fixture(scope="module")
+def run_lengths(patched_validator):
+    """
+    Run the module validator on canonical texts of the given lengths and
+    summarise its inconsistency messages as (count, any_debate).
+    
+    Inconsistency detection depends only on the two lengths, so examples that
+    redraw an already-seen pair become a cache hit instead of a process() run.
+    The memo is keyed on the lengths alone and is dropped with the fixture.
+    """
+    @functools.lru_cache(maxsize=4096)
+    def run(len_raw, len_trans):
+        reset_agent_state(patched_validator)
+        context = {**_BASE_CTX, "raw_text": "a" * len_raw, "transliterated_text": "a" * len_trans}
+        count = 0
+        debate = False
+        for m in drain(patched_validator.process(context)):
+            if "INCONSISTENCY" in m.message:
+                count += 1
+                debate = debate or m.is_debate
+        return count, debate
+    
+    return run
 
 
 # =============================================================================
 # PROPERTY 12: VALIDATOR INCONSISTENCY DETECTION
 # =============================================================================
 
-@given(
-    raw_text=arbitrary_text(min_length=10, max_length=100),
-    transliterated_text=arbitrary_text(min_length=200, max_length=500)
-)
-@settings(max_examples=100)
-@pytest.mark.asyncio
-async def test_property_validator_detects_length_inconsistency(raw_text, transliterated_text):
+@given(lengths=_pair_over_threshold())
+@settings(max_examples=100, deadline=None)
+def test_property_validator_detects_length_inconsistency(run_lengths, lengths):
     """
     Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
     Validates: Requirements 5.3
@@ -35,49 +81,23 @@ async def test_property_validator_detects_length_inconsistency(raw_text, transli
     Property: For any context where the transliterated_text length differs from 
     raw_text length by more than 30%, the Validator should flag an inconsistency.
     """
-    # Arrange
-    validator = ValidatorAgent()
-    
-    # Calculate length difference
-    len_diff = abs(len(raw_text) - len(transliterated_text)) / max(len(raw_text), 1)
-    
-    context = {
-        "raw_text": raw_text,
-        "transliterated_text": transliterated_text,
-        "ocr_confidence": 75.0,
-        "verified_facts": [],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    inconsistency_count, debate_seen = run_lengths(*lengths)
     
-    # Assert
-    if len_diff > 0.3:
-        # Should detect inconsistency
-        inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-        assert len(inconsistency_messages) > 0, \
-            f"Should detect inconsistency when length diff is {len_diff:.2%} (> 30%)"
-        
-        # Inconsistency should be marked as debate
-        assert any(m.is_debate for m in inconsistency_messages), \
-            "Inconsistency messages should be marked as debate"
-    else:
-        # Should not detect inconsistency
-        inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-        assert len(inconsistency_messages) == 0, \
-            f"Should not detect inconsistency when length diff is {len_diff:.2%} (<= 30%)"
+    # Assert - Should detect inconsistency
+    assert inconsistency_count > 0, \
+        f"Should detect inconsistency for lengths {lengths} (> 30% apart)"
+    
+    # Inconsistency should be marked as debate
+    assert debate_seen, \
+        "Inconsistency messages should be marked as debate"
 
 
 @given(
-    text=arbitrary_text(min_length=50, max_length=200)
+    text=_text_of_length(50, 200)
 )
-@settings(max_examples=100)
-@pytest.mark.asyncio
-async def test_property_validator_no_inconsistency_for_same_text(text):
+@settings(max_examples=50, deadline=None)
+def test_property_validator_no_inconsistency_for_same_text(run_lengths, text):
     """
     Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
     Validates: Requirements 5.3
@@ -85,35 +105,17 @@ async def test_property_validator_no_inconsistency_for_same_text(text):
     Property: For any text where raw_text and transliterated_text are identical,
     the Validator should not flag any inconsistency.
     """
-    # Arrange
-    validator = ValidatorAgent()
-    context = {
-        "raw_text": text,
-        "transliterated_text": text,  # Same text
-        "ocr_confidence": 75.0,
-        "verified_facts": [],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    inconsistency_count, debate_seen = run_lengths(len(text), len(text))
     
     # Assert - Should not detect any inconsistency
-    inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-    assert len(inconsistency_messages) == 0, \
+    assert inconsistency_count == 0, \
         "Should not detect inconsistency when texts are identical"
 
 
-@given(
-    base_text=arbitrary_text(min_length=100, max_length=200),
-    variation_percent=st.floats(min_value=0.0, max_value=0.29)
-)
-@settings(max_examples=100)
-@pytest.mark.asyncio
-async def test_property_validator_no_inconsistency_within_threshold(base_text, variation_percent):
+@given(lengths=_pair_within_threshold())
+@settings(max_examples=50, deadline=None)
+def test_property_validator_no_inconsistency_within_threshold(run_lengths, lengths):
     """
     Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
     Validates: Requirements 5.3
@@ -121,113 +123,70 @@ async def test_property_validator_no_inconsistency_within_threshold(base_text, v
     Property: For any text where the length difference is within 30% threshold,
     the Validator should not flag an inconsistency.
     """
-    # Arrange
-    validator = ValidatorAgent()
-    
-    # Create a variation that's within the threshold
-    target_length = int(len(base_text) * (1 + variation_percent))
-    if target_length > len(base_text):
-        varied_text = base_text + "x" * (target_length - len(base_text))
-    else:
-        varied_text = base_text[:target_length]
-    
-    context = {
-        "raw_text": base_text,
-        "transliterated_text": varied_text,
-        "ocr_confidence": 75.0,
-        "verified_facts": [],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    inconsistency_count, debate_seen = run_lengths(*lengths)
     
     # Assert - Should not detect inconsistency
-    inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-    assert len(inconsistency_messages) == 0, \
-        f"Should not detect inconsistency when variation is {variation_percent:.2%} (<= 30%)"
+    assert inconsistency_count == 0, \
+        f"Should not detect inconsistency for lengths {lengths} (<= 30% apart)"
 
 
 @given(
-    base_text=arbitrary_text(min_length=50, max_length=100),
-    multiplier=st.floats(min_value=2.0, max_value=5.0)
+    base_text=_text_of_length(50, 200),
+    factor=st.floats(min_value=0.2, max_value=5.0)
 )
-@settings(max_examples=100)
-@pytest.mark.asyncio
-async def test_property_validator_detects_large_expansion(base_text, multiplier):
+@settings(max_examples=100, deadline=None)
+def test_property_validator_detects_length_delta(run_lengths, base_text, factor):
     """
     Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
     Validates: Requirements 5.3
     
-    Property: For any text that expands by more than 30% during transliteration,
-    the Validator should flag an inconsistency.
+    Property: For any text that expands or shrinks during transliteration, the
+    Validator should flag an inconsistency exactly when the length changes by
+    more than 30%.
     """
-    # Arrange
-    validator = ValidatorAgent()
-    
-    # Create expanded text (multiply length)
-    target_length = int(len(base_text) * multiplier)
-    expanded_text = base_text + "x" * (target_length - len(base_text))
-    
-    context = {
-        "raw_text": base_text,
-        "transliterated_text": expanded_text,
-        "ocr_confidence": 75.0,
-        "verified_facts": [],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
+    # Arrange - only the scaled length matters, so no scaled text is built
+    target_length = max(1, int(len(base_text) * factor))
+    len_diff = abs(len(base_text) - target_length) / len(base_text)
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    inconsistency_count, debate_seen = run_lengths(len(base_text), target_length)
     
-    # Assert - Should detect inconsistency
-    inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-    assert len(inconsistency_messages) > 0, \
-        f"Should detect inconsistency when text expands by {multiplier}x (> 30%)"
+    # Assert - Inconsistency flagged iff the change exceeds the threshold
+    if len_diff > 0.3:
+        assert inconsistency_count > 0, \
+            f"Should detect inconsistency when length changes by {len_diff:.2%} (> 30%)"
+    else:
+        assert inconsistency_count == 0, \
+            f"Should not detect inconsistency when length changes by {len_diff:.2%} (<= 30%)"
 
 
-@given(
-    base_text=arbitrary_text(min_length=100, max_length=200),
-    reduction_percent=st.floats(min_value=0.4, max_value=0.8)
+# Deterministic (raw_length, scale_factor) grid checked in one pass below,
+# covering contraction (0.2x-0.95x) as well as expansion (1.0x-2.2x)
+_SCALE_CASES = tuple(
+    (base, factor)
+    for base in (50, 100, 150, 200)
+    for factor in [step / 20 for step in range(4, 20)] + [1 + step / 20 for step in range(25)]
 )
-@settings(max_examples=100)
-@pytest.mark.asyncio
-async def test_property_validator_detects_large_reduction(base_text, reduction_percent):
+
+
+def test_validator_detects_length_change_batched(validator):
     """
     Feature: code-quality-validation, Property 12: Validator Inconsistency Detection
     Validates: Requirements 5.3
     
-    Property: For any text that shrinks by more than 30% during transliteration,
-    the Validator should flag an inconsistency.
+    Batched companion to the delta property: sweeps a fixed grid of expansions
+    and contractions through _detect_inconsistencies directly, with no agent
+    run per case.
     """
-    # Arrange
-    validator = ValidatorAgent()
-    
-    # Create reduced text
-    target_length = int(len(base_text) * reduction_percent)
-    reduced_text = base_text[:max(1, target_length)]
-    
-    context = {
-        "raw_text": base_text,
-        "transliterated_text": reduced_text,
-        "ocr_confidence": 75.0,
-        "verified_facts": [],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
-    # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
-    
-    # Assert - Should detect inconsistency
-    inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
-    assert len(inconsistency_messages) > 0, \
-        f"Should detect inconsistency when text reduces to {reduction_percent:.2%} (> 30% change)"
+    for base, factor in _SCALE_CASES:
+        # Arrange
+        context = {"raw_text": "a" * base, "transliterated_text": "a" * int(base * factor)}
+        len_diff = abs(base - len(context["transliterated_text"])) / base
+        
+        # Act
+        inconsistencies = validator._detect_inconsistencies(context)
+        
+        # Assert
+        assert bool(inconsistencies) == (len_diff > 0.3), \
+            f"Scaling {base} chars by {factor:.2f}x flagged={bool(inconsistencies)}"
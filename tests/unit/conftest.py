@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the agent unit tests.
+
+Agents are built once per session; the per-test fixtures clear their
+per-run state with ``reset_agent_state`` so every test starts clean.
+"""
+import pytest
+
+from main import HistorianAgent, LinguistAgent, ScannerAgent, ValidatorAgent
+from tests.fixtures import reset_agent_state
+from tests.generators import FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def _historian_agent():
+    return HistorianAgent()
+
+
+@pytest.fixture(scope="session")
+def _linguist_agent():
+    return LinguistAgent()
+
+
+@pytest.fixture(scope="session")
+def _scanner_agent():
+    return ScannerAgent()
+
+
+@pytest.fixture(scope="session")
+def _validator_agent():
+    return ValidatorAgent()
+
+
+@pytest.fixture
+def historian(_historian_agent):
+    """Session Historian with per-run state cleared."""
+    reset_agent_state(_historian_agent)
+    return _historian_agent
+
+
+@pytest.fixture
+def linguist(_linguist_agent):
+    """Session Linguist with per-run state cleared."""
+    reset_agent_state(_linguist_agent)
+    return _linguist_agent
+
+
+@pytest.fixture
+def scanner(_scanner_agent):
+    """Session Scanner with per-run state cleared; tests may override api_key."""
+    api_key = _scanner_agent.api_key
+    reset_agent_state(_scanner_agent)
+    yield _scanner_agent
+    _scanner_agent.api_key = api_key
+
+
+@pytest.fixture
+def validator(_validator_agent):
+    """Session Validator with per-run state cleared."""
+    reset_agent_state(_validator_agent)
+    return _validator_agent
+
+
+@pytest.fixture
+def base_context():
+    """Fresh context skeleton; no unit test checks timing, so start_time is fixed."""
+    return {"start_time": FROZEN_NOW}
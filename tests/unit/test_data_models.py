@@ -9,8 +9,6 @@ from datetime import datetime
 from typing import List
 
 # Import models from main.py
-import sys
-sys.path.insert(0, '.')
 from main import (
     AgentType, ConfidenceLevel, AgentMessage, TextSegment,
     RepairRecommendation, DamageHotspot, ResurrectionResult
@@ -61,19 +59,17 @@ def test_agent_message_minimal_fields():
 
 
 @pytest.mark.unit
-def test_agent_message_all_agent_types():
+@pytest.mark.parametrize("agent_type", [
+    AgentType.SCANNER,
+    AgentType.LINGUIST,
+    AgentType.HISTORIAN,
+    AgentType.VALIDATOR,
+    AgentType.REPAIR_ADVISOR
+])
+def test_agent_message_all_agent_types(agent_type):
     """Test AgentMessage with all agent types."""
-    agent_types = [
-        AgentType.SCANNER,
-        AgentType.LINGUIST,
-        AgentType.HISTORIAN,
-        AgentType.VALIDATOR,
-        AgentType.REPAIR_ADVISOR
-    ]
-    
-    for agent_type in agent_types:
-        msg = AgentMessage(agent=agent_type, message=f"Message from {agent_type.value}")
-        assert msg.agent == agent_type
+    msg = AgentMessage(agent=agent_type, message=f"Message from {agent_type.value}")
+    assert msg.agent == agent_type
 
 
 # =============================================================================
@@ -111,17 +107,15 @@ def test_text_segment_with_all_fields():
 
 
 @pytest.mark.unit
-def test_text_segment_all_confidence_levels():
+@pytest.mark.parametrize("level", [
+    ConfidenceLevel.HIGH,
+    ConfidenceLevel.MEDIUM,
+    ConfidenceLevel.LOW
+])
+def test_text_segment_all_confidence_levels(level):
     """Test TextSegment with all confidence levels."""
-    confidence_levels = [
-        ConfidenceLevel.HIGH,
-        ConfidenceLevel.MEDIUM,
-        ConfidenceLevel.LOW
-    ]
-    
-    for level in confidence_levels:
-        segment = TextSegment(text="Test", confidence=level)
-        assert segment.confidence == level
+    segment = TextSegment(text="Test", confidence=level)
+    assert segment.confidence == level
 
 
 # =============================================================================
@@ -160,17 +154,15 @@ def test_repair_recommendation_with_all_fields():
 
 
 @pytest.mark.unit
-def test_repair_recommendation_all_severity_levels():
+@pytest.mark.parametrize("severity", ["critical", "moderate", "minor"])
+def test_repair_recommendation_all_severity_levels(severity):
     """Test RepairRecommendation with all severity levels."""
-    severities = ["critical", "moderate", "minor"]
-    
-    for severity in severities:
-        rec = RepairRecommendation(
-            issue=f"{severity} issue",
-            severity=severity,
-            recommendation=f"Treatment for {severity}"
-        )
-        assert rec.severity == severity
+    rec = RepairRecommendation(
+        issue=f"{severity} issue",
+        severity=severity,
+        recommendation=f"Treatment for {severity}"
+    )
+    assert rec.severity == severity
 
 
 # =============================================================================
@@ -202,54 +194,49 @@ def test_damage_hotspot_creation_with_all_required_fields():
 
 
 @pytest.mark.unit
-def test_damage_hotspot_coordinate_boundaries():
+@pytest.mark.parametrize("x,y", [
+    (0.0, 0.0),      # Top-left
+    (100.0, 0.0),    # Top-right
+    (0.0, 100.0),    # Bottom-left
+    (100.0, 100.0),  # Bottom-right
+])
+def test_damage_hotspot_coordinate_boundaries(x, y):
     """Test DamageHotspot with boundary coordinates (0-100)."""
-    # Test corners
-    corners = [
-        (0.0, 0.0),      # Top-left
-        (100.0, 0.0),    # Top-right
-        (0.0, 100.0),    # Bottom-left
-        (100.0, 100.0),  # Bottom-right
-    ]
-    
-    for i, (x, y) in enumerate(corners):
-        hotspot = DamageHotspot(
-            id=i,
-            x=x,
-            y=y,
-            damage_type="test",
-            severity="minor",
-            label="Test",
-            treatment="Test",
-            icon="⚠️"
-        )
-        assert hotspot.x == x
-        assert hotspot.y == y
+    hotspot = DamageHotspot(
+        id=1,
+        x=x,
+        y=y,
+        damage_type="test",
+        severity="minor",
+        label="Test",
+        treatment="Test",
+        icon="⚠️"
+    )
+    assert hotspot.x == x
+    assert hotspot.y == y
 
 
 @pytest.mark.unit
-def test_damage_hotspot_different_damage_types():
+@pytest.mark.parametrize("damage_type", [
+    "iron_gall_ink",
+    "foxing",
+    "tears",
+    "fading",
+    "water_damage"
+])
+def test_damage_hotspot_different_damage_types(damage_type):
     """Test DamageHotspot with various damage types."""
-    damage_types = [
-        "iron_gall_ink",
-        "foxing",
-        "tears",
-        "fading",
-        "water_damage"
-    ]
-    
-    for i, damage_type in enumerate(damage_types):
-        hotspot = DamageHotspot(
-            id=i,
-            x=50.0,
-            y=50.0,
-            damage_type=damage_type,
-            severity="moderate",
-            label=f"{damage_type} damage",
-            treatment=f"Treatment for {damage_type}",
-            icon="⚠️"
-        )
-        assert hotspot.damage_type == damage_type
+    hotspot = DamageHotspot(
+        id=1,
+        x=50.0,
+        y=50.0,
+        damage_type=damage_type,
+        severity="moderate",
+        label=f"{damage_type} damage",
+        treatment=f"Treatment for {damage_type}",
+        icon="⚠️"
+    )
+    assert hotspot.damage_type == damage_type
 
 
 # =============================================================================
@@ -347,12 +334,12 @@ def test_resurrection_result_with_all_fields():
 def test_resurrection_result_with_multiple_segments():
     """Test ResurrectionResult with multiple text segments."""
     segments = [
-        TextSegment(text="Segment 1", confidence=ConfidenceLevel.HIGH),
-        TextSegment(text="Segment 2", confidence=ConfidenceLevel.MEDIUM),
-        TextSegment(text="Segment 3", confidence=ConfidenceLevel.LOW)
+        TextSegment.model_construct(text="Segment 1", confidence=ConfidenceLevel.HIGH),
+        TextSegment.model_construct(text="Segment 2", confidence=ConfidenceLevel.MEDIUM),
+        TextSegment.model_construct(text="Segment 3", confidence=ConfidenceLevel.LOW)
     ]
     messages = [
-        AgentMessage(agent=AgentType.SCANNER, message="Test")
+        AgentMessage.model_construct(agent=AgentType.SCANNER, message="Test")
     ]
     
     result = ResurrectionResult(
@@ -371,13 +358,13 @@ def test_resurrection_result_with_multiple_segments():
 @pytest.mark.unit
 def test_resurrection_result_with_multiple_agent_messages():
     """Test ResurrectionResult with messages from all agents."""
-    segments = [TextSegment(text="Test", confidence=ConfidenceLevel.HIGH)]
+    segments = [TextSegment.model_construct(text="Test", confidence=ConfidenceLevel.HIGH)]
     messages = [
-        AgentMessage(agent=AgentType.SCANNER, message="Scanner done"),
-        AgentMessage(agent=AgentType.LINGUIST, message="Linguist done"),
-        AgentMessage(agent=AgentType.HISTORIAN, message="Historian done"),
-        AgentMessage(agent=AgentType.VALIDATOR, message="Validator done"),
-        AgentMessage(agent=AgentType.REPAIR_ADVISOR, message="Repair done")
+        AgentMessage.model_construct(agent=AgentType.SCANNER, message="Scanner done"),
+        AgentMessage.model_construct(agent=AgentType.LINGUIST, message="Linguist done"),
+        AgentMessage.model_construct(agent=AgentType.HISTORIAN, message="Historian done"),
+        AgentMessage.model_construct(agent=AgentType.VALIDATOR, message="Validator done"),
+        AgentMessage.model_construct(agent=AgentType.REPAIR_ADVISOR, message="Repair done")
     ]
     
     result = ResurrectionResult(
@@ -20,6 +20,7 @@ from tests.fixtures import (
 
 # Import generators
 from tests.generators import (
+    DOKE_CHARACTERS,
     arbitrary_text,
     arbitrary_confidence,
     arbitrary_coordinates,
@@ -29,23 +30,24 @@ from tests.generators import (
     arbitrary_resurrection_result,
 )
 
-from hypothesis import given, settings, HealthCheck
+from hypothesis import given, settings, HealthCheck, Phase
 from hypothesis import strategies as st
 
+# Built once from the generators' canonical list rather than a local copy
+_DOKE_CHARS = frozenset(DOKE_CHARACTERS)
+
 
 @pytest.mark.unit
 def test_sample_doke_text_contains_doke_characters():
     """Verify sample Doke text contains Doke characters."""
-    doke_chars = ['ɓ', 'ɗ', 'ȿ', 'ɀ', 'ŋ', 'ʃ', 'ʒ', 'ṱ', 'ḓ', 'ḽ', 'ṋ']
-    assert any(char in SAMPLE_DOKE_TEXT for char in doke_chars), \
+    assert not _DOKE_CHARS.isdisjoint(SAMPLE_DOKE_TEXT), \
         "Sample Doke text should contain at least one Doke character"
 
 
 @pytest.mark.unit
 def test_sample_modern_text_no_doke_characters():
     """Verify sample modern text has no Doke characters."""
-    doke_chars = ['ɓ', 'ɗ', 'ȿ', 'ɀ', 'ŋ', 'ʃ', 'ʒ', 'ṱ', 'ḓ', 'ḽ', 'ṋ']
-    assert not any(char in SAMPLE_MODERN_TEXT for char in doke_chars), \
+    assert _DOKE_CHARS.isdisjoint(SAMPLE_MODERN_TEXT), \
         "Sample modern text should not contain Doke characters"
 
 
@@ -118,9 +120,13 @@ def test_resurrection_result_fixture(sample_resurrection_result):
 # GENERATOR TESTS
 # =============================================================================
 
+# One generated value is enough to check a generator's output shape; the
+# composite resurrection-result test below keeps 10 examples for coverage
+_ONCE = settings(max_examples=1, database=None, phases=[Phase.generate])
+
 @pytest.mark.property
 @given(text=arbitrary_text())
-@settings(max_examples=10, suppress_health_check=[HealthCheck.too_slow])
+@_ONCE
 def test_arbitrary_text_generator(text):
     """Verify arbitrary_text generator produces valid text."""
     assert isinstance(text, str)
@@ -130,7 +136,7 @@ def test_arbitrary_text_generator(text):
 
 @pytest.mark.property
 @given(confidence=arbitrary_confidence())
-@settings(max_examples=10)
+@_ONCE
 def test_arbitrary_confidence_generator(confidence):
     """Verify arbitrary_confidence generator produces valid confidence scores."""
     assert isinstance(confidence, float)
@@ -140,7 +146,7 @@ def test_arbitrary_confidence_generator(confidence):
 
 @pytest.mark.property
 @given(coords=arbitrary_coordinates())
-@settings(max_examples=10)
+@_ONCE
 def test_arbitrary_coordinates_generator(coords):
     """Verify arbitrary_coordinates generator produces valid coordinates."""
     x, y = coords
@@ -152,7 +158,7 @@ def test_arbitrary_coordinates_generator(coords):
 
 @pytest.mark.property
 @given(message=arbitrary_agent_message())
-@settings(max_examples=10)
+@_ONCE
 def test_arbitrary_agent_message_generator(message):
     """Verify arbitrary_agent_message generator produces valid messages."""
     assert message.agent.value in ['scanner', 'linguist', 'historian', 'validator', 'repair_advisor']
@@ -164,7 +170,7 @@ def test_arbitrary_agent_message_generator(message):
 
 @pytest.mark.property
 @given(segment=arbitrary_text_segment())
-@settings(max_examples=10)
+@_ONCE
 def test_arbitrary_text_segment_generator(segment):
     """Verify arbitrary_text_segment generator produces valid segments."""
     assert len(segment.text) >= 10
@@ -173,7 +179,7 @@ def test_arbitrary_text_segment_generator(segment):
 
 @pytest.mark.property
 @given(hotspot=arbitrary_damage_hotspot())
-@settings(max_examples=10)
+@_ONCE
 def test_arbitrary_damage_hotspot_generator(hotspot):
     """Verify arbitrary_damage_hotspot generator produces valid hotspots."""
     assert hotspot.id > 0
@@ -185,7 +191,8 @@ def test_arbitrary_damage_hotspot_generator(hotspot):
 
 @pytest.mark.property
 @given(result=arbitrary_resurrection_result())
-@settings(max_examples=10)
+@settings(max_examples=10, database=None, phases=[Phase.generate],
+          suppress_health_check=[HealthCheck.too_slow])
 def test_arbitrary_resurrection_result_generator(result):
     """Verify arbitrary_resurrection_result generator produces valid results."""
     assert len(result.segments) >= 1
@@ -5,47 +5,42 @@ Tests specific examples, edge cases, and error conditions.
 Requirements: 5.2, 5.5
 """
 import pytest
-import asyncio
-from datetime import datetime
 
-# Import from main.py
-import sys
-sys.path.insert(0, '.')
-from main import ValidatorAgent, AgentType
+# Import from main.py (pytest.ini puts the repo root on sys.path)
+from main import AgentType, ValidatorAgent
+from tests.fixtures import collect, find_messages
+
+_HIGH_THRESHOLD = ValidatorAgent.CONFIDENCE_THRESHOLDS["high"]
 
 
 # =============================================================================
 # UNIT TESTS - SPECIFIC EXAMPLES
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_validator_with_low_ocr_confidence():
+async def test_validator_with_low_ocr_confidence(validator, base_context):
     """
     Test Validator with low OCR confidence (example).
     
     Requirements: 5.2
     """
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Some text extracted from document",
         "transliterated_text": "Some text extracted from document",
         "ocr_confidence": 45.0,  # Below medium threshold (60)
         "verified_facts": ["Fact 1", "Fact 2"],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     assert len(messages) > 0, "Should emit at least one message"
     
     # Check that low confidence warning is issued
-    warning_messages = [m for m in messages if "WARNING" in m.message and "confidence" in m.message.lower()]
+    warning_messages = find_messages(messages, "WARNING", icase_needles=("confidence",))
     assert len(warning_messages) > 0, "Should emit warning for low OCR confidence"
     
     # Check that warning is marked as debate
@@ -61,69 +56,61 @@ async def test_validator_with_low_ocr_confidence():
     assert any("confidence" in w.lower() for w in context["validator_warnings"]), "Should warn about confidence"
 
 
-@pytest.mark.asyncio
-async def test_validator_with_high_confidence():
+async def test_validator_with_high_confidence(validator, base_context):
     """
     Test Validator with high confidence.
     
     Requirements: 5.2
     """
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Clear text with high OCR quality",
         "transliterated_text": "Clear text with high OCR quality",
         "ocr_confidence": 92.0,  # Above high threshold (80)
         "verified_facts": ["Fact 1", "Fact 2", "Fact 3"],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     assert len(messages) > 0, "Should emit at least one message"
     
     # Check that no warnings are issued for high confidence
-    warning_messages = [m for m in messages if "WARNING" in m.message and "confidence" in m.message.lower()]
+    warning_messages = find_messages(messages, "WARNING", icase_needles=("confidence",))
     assert len(warning_messages) == 0, "Should not emit warning for high OCR confidence"
     
     # Check that final confidence is calculated
     assert "final_confidence" in context, "Should populate final_confidence"
     
     # Final confidence should be high
-    assert context["final_confidence"] >= validator.CONFIDENCE_THRESHOLDS["high"], "Final confidence should be high"
+    assert context["final_confidence"] >= _HIGH_THRESHOLD, "Final confidence should be high"
     
     # Check completion message indicates HIGH confidence level
-    completion_messages = [m for m in messages if "COMPLETE" in m.message and "HIGH" in m.message]
+    completion_messages = find_messages(messages, "COMPLETE", "HIGH")
     assert len(completion_messages) > 0, "Should indicate HIGH confidence level"
 
 
-@pytest.mark.asyncio
-async def test_validator_with_ai_validation_available():
+async def test_validator_with_ai_validation_available(validator, base_context):
     """
     Test Validator with AI validation available (example).
     
     Requirements: 5.5
     """
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Historical document about Lobengula and Rudd in 1888",
         "transliterated_text": "Historical document about Lobengula and Rudd in 1888",
         "ocr_confidence": 75.0,
         "verified_facts": ["Rudd-Lobengula treaty context", "Date 1888 verified"],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     assert len(messages) > 0, "Should emit at least one message"
@@ -132,7 +119,7 @@ async def test_validator_with_ai_validation_available():
     assert "final_confidence" in context, "Should populate final_confidence"
     
     # Check that validator completes
-    completion_messages = [m for m in messages if "COMPLETE" in m.message]
+    completion_messages = find_messages(messages, "COMPLETE")
     assert len(completion_messages) > 0, "Should emit completion message"
 
 
@@ -141,24 +128,20 @@ async def test_validator_with_ai_validation_available():
 # UNIT TESTS - EDGE CASES
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_validator_with_empty_text():
+async def test_validator_with_empty_text(validator, base_context):
     """Test Validator with empty text."""
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "",
         "transliterated_text": "",
         "ocr_confidence": 50.0,
         "verified_facts": [],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     assert len(messages) > 0, "Should emit messages even with empty text"
@@ -166,76 +149,64 @@ async def test_validator_with_empty_text():
     assert "validator_warnings" in context
 
 
-@pytest.mark.asyncio
-async def test_validator_with_missing_context_fields():
+async def test_validator_with_missing_context_fields(validator, base_context):
     """Test Validator with missing context fields."""
     # Arrange
-    validator = ValidatorAgent()
     context = {
-        "start_time": datetime.utcnow()
+        **base_context
         # Missing most fields
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     assert len(messages) > 0, "Should handle missing fields gracefully"
     assert "final_confidence" in context, "Should still calculate final confidence"
 
 
-@pytest.mark.asyncio
-async def test_validator_with_inconsistent_text_lengths():
+async def test_validator_with_inconsistent_text_lengths(validator, base_context):
     """Test Validator detects inconsistency when text length changes drastically."""
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Short text",  # 10 characters
         "transliterated_text": "This is a much longer text that has been significantly expanded during transliteration process",  # Much longer
         "ocr_confidence": 75.0,
         "verified_facts": [],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     # Check that inconsistency is detected
-    inconsistency_messages = [m for m in messages if "INCONSISTENCY" in m.message]
+    inconsistency_messages = find_messages(messages, "INCONSISTENCY")
     assert len(inconsistency_messages) > 0, "Should detect text length inconsistency"
     
     # Check that inconsistency is marked as debate
     assert any(m.is_debate for m in inconsistency_messages), "Inconsistency should be marked as debate"
 
 
-@pytest.mark.asyncio
-async def test_validator_with_anomalies():
+async def test_validator_with_anomalies(validator, base_context):
     """Test Validator handles historical anomalies."""
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Some historical text",
         "transliterated_text": "Some historical text",
         "ocr_confidence": 70.0,
         "verified_facts": ["Fact 1"],
         "historical_anomalies": ["Anomaly 1: Date mismatch", "Anomaly 2: Figure not found"],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert
     # Check that anomalies are reported
-    anomaly_messages = [m for m in messages if "ANOMALY" in m.message]
+    anomaly_messages = find_messages(messages, "ANOMALY")
     assert len(anomaly_messages) >= 2, "Should report all anomalies"
     
     # Check that anomalies are marked as debate
@@ -246,61 +217,31 @@ async def test_validator_with_anomalies():
 # UNIT TESTS - HELPER METHODS
 # =============================================================================
 
-def test_detect_inconsistencies_method():
+def test_detect_inconsistencies_method(validator):
     """Test the _detect_inconsistencies method directly."""
     # Arrange
-    validator = ValidatorAgent()
-    context = {
+    changed = {
         "raw_text": "Short",  # 5 characters
         "transliterated_text": "This is much longer text",  # 24 characters
     }
-    
-    # Act
-    inconsistencies = validator._detect_inconsistencies(context)
-    
-    # Assert
-    assert len(inconsistencies) > 0, "Should detect inconsistency"
-    assert any("length" in inc.lower() for inc in inconsistencies), "Should mention length change"
-
-
-def test_detect_inconsistencies_no_change():
-    """Test that no inconsistency is detected for similar length texts."""
-    # Arrange
-    validator = ValidatorAgent()
-    context = {
+    unchanged = {
         "raw_text": "This is some text",
         "transliterated_text": "This is some text",  # Same length
     }
     
     # Act
-    inconsistencies = validator._detect_inconsistencies(context)
+    inconsistencies = validator._detect_inconsistencies(changed)
+    no_inconsistencies = validator._detect_inconsistencies(unchanged)
     
     # Assert
-    assert len(inconsistencies) == 0, "Should not detect inconsistency for same length"
-
-
-def test_calculate_final_confidence_method():
-    """Test the _calculate_final_confidence method directly."""
-    # Arrange
-    validator = ValidatorAgent()
-    context = {
-        "ocr_confidence": 80.0,
-        "verified_facts": ["Fact 1", "Fact 2"],
-        "validator_warnings": []
-    }
-    
-    # Act
-    final_confidence = validator._calculate_final_confidence(context)
-    
-    # Assert
-    assert 0 <= final_confidence <= 100, "Confidence should be between 0 and 100"
-    assert final_confidence > 0, "Should have positive confidence with good inputs"
+    assert len(inconsistencies) > 0, "Should detect inconsistency"
+    assert any("length" in inc.lower() for inc in inconsistencies), "Should mention length change"
+    assert len(no_inconsistencies) == 0, "Should not detect inconsistency for same length"
 
 
-def test_calculate_final_confidence_with_warnings():
-    """Test that warnings reduce final confidence."""
+def test_calculate_final_confidence_method(validator):
+    """Test _calculate_final_confidence bounds and that warnings reduce it."""
     # Arrange
-    validator = ValidatorAgent()
     validator.warnings = ["Warning 1", "Warning 2", "Warning 3"]
     
     context_no_warnings = {
@@ -310,8 +251,7 @@ def test_calculate_final_confidence_with_warnings():
     }
     
     context_with_warnings = {
-        "ocr_confidence": 80.0,
-        "verified_facts": ["Fact 1", "Fact 2"],
+        **context_no_warnings,
         "validator_warnings": validator.warnings
     }
     
@@ -320,6 +260,8 @@ def test_calculate_final_confidence_with_warnings():
     confidence_with_warnings = validator._calculate_final_confidence(context_with_warnings)
     
     # Assert
+    assert 0 <= confidence_no_warnings <= 100, "Confidence should be between 0 and 100"
+    assert confidence_no_warnings > 0, "Should have positive confidence with good inputs"
     assert confidence_with_warnings < confidence_no_warnings, "Warnings should reduce confidence"
 
 
@@ -327,24 +269,20 @@ def test_calculate_final_confidence_with_warnings():
 # UNIT TESTS - CONTEXT POPULATION
 # =============================================================================
 
-@pytest.mark.asyncio
-async def test_validator_populates_all_required_context_fields():
+async def test_validator_populates_all_required_context_fields(validator, base_context):
     """Test that Validator populates all required context fields."""
     # Arrange
-    validator = ValidatorAgent()
     context = {
         "raw_text": "Some text",
         "transliterated_text": "Some text",
         "ocr_confidence": 75.0,
         "verified_facts": ["Fact 1"],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
     # Act
-    messages = []
-    async for msg in validator.process(context):
-        messages.append(msg)
+    messages = await collect(validator.process(context))
     
     # Assert - Check all required fields are populated
     assert "final_confidence" in context, "Should populate final_confidence"
@@ -357,12 +295,8 @@ async def test_validator_populates_all_required_context_fields():
     assert isinstance(context["validator_corrections"], list)
 
 
-@pytest.mark.asyncio
-async def test_validator_agent_type_and_metadata():
+async def test_validator_agent_type_and_metadata(validator):
     """Test that Validator has correct agent type and metadata."""
-    # Arrange
-    validator = ValidatorAgent()
-    
     # Assert
     assert validator.agent_type == AgentType.VALIDATOR
     assert validator.name == "Validator"
@@ -380,61 +314,26 @@ async def test_validator_agent_type_and_metadata():
     assert validator.CONFIDENCE_THRESHOLDS["low"] == 40
 
 
-@pytest.mark.asyncio
-async def test_validator_confidence_level_classification():
+@pytest.mark.parametrize("ocr_confidence, num_facts, expected_level", [
+    pytest.param(90.0, 5, "HIGH", id="high"),
+    pytest.param(65.0, 1, "MEDIUM", id="medium"),
+    pytest.param(30.0, 0, "LOW", id="low"),
+])
+async def test_validator_confidence_level_classification(validator, ocr_confidence, num_facts, expected_level, base_context):
     """Test that Validator correctly classifies confidence levels."""
     # Arrange
-    validator = ValidatorAgent()
-    
-    # Test HIGH confidence
-    context_high = {
-        "raw_text": "Text",
-        "transliterated_text": "Text",
-        "ocr_confidence": 90.0,
-        "verified_facts": ["F1", "F2", "F3", "F4", "F5"],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
-    messages_high = []
-    async for msg in validator.process(context_high):
-        messages_high.append(msg)
-    
-    completion_high = [m for m in messages_high if "COMPLETE" in m.message]
-    assert any("HIGH" in m.message for m in completion_high), "Should classify as HIGH"
-    
-    # Test MEDIUM confidence
-    validator2 = ValidatorAgent()
-    context_medium = {
-        "raw_text": "Text",
-        "transliterated_text": "Text",
-        "ocr_confidence": 65.0,
-        "verified_facts": ["F1"],
-        "historical_anomalies": [],
-        "start_time": datetime.utcnow()
-    }
-    
-    messages_medium = []
-    async for msg in validator2.process(context_medium):
-        messages_medium.append(msg)
-    
-    completion_medium = [m for m in messages_medium if "COMPLETE" in m.message]
-    assert any("MEDIUM" in m.message for m in completion_medium), "Should classify as MEDIUM"
-    
-    # Test LOW confidence
-    validator3 = ValidatorAgent()
-    context_low = {
+    context = {
         "raw_text": "Text",
         "transliterated_text": "Text",
-        "ocr_confidence": 30.0,
-        "verified_facts": [],
+        "ocr_confidence": ocr_confidence,
+        "verified_facts": [f"F{i}" for i in range(1, num_facts + 1)],
         "historical_anomalies": [],
-        "start_time": datetime.utcnow()
+        **base_context
     }
     
-    messages_low = []
-    async for msg in validator3.process(context_low):
-        messages_low.append(msg)
+    # Act
+    messages = await collect(validator.process(context))
     
-    completion_low = [m for m in messages_low if "COMPLETE" in m.message]
-    assert any("LOW" in m.message for m in completion_low), "Should classify as LOW"
+    # Assert
+    completion = find_messages(messages, "COMPLETE")
+    assert any(expected_level in m.message for m in completion), f"Should classify as {expected_level}"
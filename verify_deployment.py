@@ -14,10 +14,12 @@ Usage:
 """
 
 import asyncio
+import importlib.util
 import os
 import sys
 import time
 import json
+import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +37,34 @@ REQUIRED_FILES = [
     "src/assets/linguist_test.png"
 ]
 
+PYTHON_DEPENDENCIES = ("fastapi", "httpx", "cv2", "numpy", "PIL")
+
+# Only the end of the npm output (the summary) is kept in the report
+NPM_OUTPUT_TAIL_BYTES = 4096
+
+# ImageComparison.tsx must contain every token of a check for it to pass
+SLIDER_CHECKS = (
+    ("autoReveal prop", ("autoReveal",)),
+    ("useEffect for animation", ("useEffect", "animate")),
+    ("slider position state", ("sliderPosition", "useState")),
+    ("requestAnimationFrame", ("requestAnimationFrame",)),
+    ("auto-reveal message", ("Watch the AI restoration reveal",)),
+)
+
+# Agent messages worth echoing while the backend runs
+KEY_MESSAGE_RE = re.compile(r"enhanced|detected|found|analysis", re.IGNORECASE)
+
+async def _skipped():
+    """Stand-in for a step whose prerequisite failed"""
+    return False
+
+
+def _print_lines(lines):
+    """Print a step's buffered output as one block"""
+    if lines:
+        print("\n".join(lines))
+
+
 class DeploymentVerifier:
     def __init__(self):
         self.results = {}
@@ -45,9 +75,19 @@ class DeploymentVerifier:
         print("🔍 STEP 1: File Structure Verification")
         print("-" * 50)
         
+        # One directory listing per parent instead of one stat per file
+        listings = {}
+        for directory in {os.path.dirname(file_path) for file_path in REQUIRED_FILES}:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                listings[directory] = set()
+        
         missing_files = []
         for file_path in REQUIRED_FILES:
-            if os.path.exists(file_path):
+            directory, name = os.path.split(file_path)
+            if name in listings[directory]:
                 print(f"   ✅ {file_path}")
             else:
                 print(f"   ❌ {file_path} - MISSING")
@@ -60,47 +100,43 @@ class DeploymentVerifier:
         print(f"\n✅ All required files present")
         return True
     
-    def check_environment_setup(self):
+    def check_environment_setup(self, log=print):
         """Verify environment variables and dependencies"""
-        print("\n🔧 STEP 2: Environment Setup")
-        print("-" * 50)
+        log("\n🔧 STEP 2: Environment Setup")
+        log("-" * 50)
         
         # Check API key
         api_key = os.getenv("NOVITA_AI_API_KEY")
         if api_key:
-            print(f"   ✅ NOVITA_AI_API_KEY: {api_key[:10]}...")
+            log(f"   ✅ NOVITA_AI_API_KEY: {api_key[:10]}...")
         else:
-            print(f"   ❌ NOVITA_AI_API_KEY not set")
+            log(f"   ❌ NOVITA_AI_API_KEY not set")
             return False
         
-        # Check Python dependencies
-        try:
-            import fastapi
-            import httpx
-            import cv2
-            import numpy
-            from PIL import Image
-            print(f"   ✅ Python dependencies installed")
-        except ImportError as e:
-            print(f"   ❌ Missing Python dependency: {e}")
+        # Check Python dependencies are installed without importing them;
+        # the backend step does the real (slow, for cv2) imports
+        missing = [name for name in PYTHON_DEPENDENCIES if importlib.util.find_spec(name) is None]
+        if missing:
+            log(f"   ❌ Missing Python dependency: {', '.join(missing)}")
             return False
+        log(f"   ✅ Python dependencies installed")
         
         # Check if Node.js is available for frontend tests
         try:
             result = subprocess.run(["node", "--version"], capture_output=True, text=True)
             if result.returncode == 0:
-                print(f"   ✅ Node.js: {result.stdout.strip()}")
+                log(f"   ✅ Node.js: {result.stdout.strip()}")
             else:
-                print(f"   ⚠️  Node.js not available (frontend tests will be skipped)")
+                log(f"   ⚠️  Node.js not available (frontend tests will be skipped)")
         except FileNotFoundError:
-            print(f"   ⚠️  Node.js not found (frontend tests will be skipped)")
+            log(f"   ⚠️  Node.js not found (frontend tests will be skipped)")
         
         return True
     
-    async def test_backend_agents(self):
+    async def test_backend_agents(self, log=print):
         """Test backend agents for agentic behavior"""
-        print("\n🤖 STEP 3: Backend Agent Testing")
-        print("-" * 50)
+        log("\n🤖 STEP 3: Backend Agent Testing")
+        log("-" * 50)
         
         # Set up environment
         os.environ['NOVITA_AI_API_KEY'] = os.getenv('NOVITA_AI_API_KEY', '')
@@ -113,28 +149,28 @@ class DeploymentVerifier:
             # Test with real image
             test_image = "src/assets/BSAC_Archive_Record_1896.png"
             
-            with open(test_image, 'rb') as f:
-                image_data = f.read()
+            # Read on a worker thread so the event loop is not blocked on disk
+            image_data = await asyncio.to_thread(Path(test_image).read_bytes)
             
-            print(f"   📁 Testing with: {test_image} ({len(image_data)/1024:.1f} KB)")
+            log(f"   📁 Testing with: {test_image} ({len(image_data)/1024:.1f} KB)")
             
             # Track API usage
             initial_stats = api_tracker.get_stats()
             
             # Process document
             orchestrator = SwarmOrchestrator()
-            messages = []
+            message_count = 0
             unique_responses = set()
             
             start_time = time.time()
             
             async for message in orchestrator.resurrect(image_data):
-                messages.append(message)
+                message_count += 1
                 unique_responses.add(message.message)
                 
                 # Print key messages
-                if any(keyword in message.message.lower() for keyword in ["enhanced", "detected", "found", "analysis"]):
-                    print(f"   🔍 {message.agent.value}: {message.message[:60]}...")
+                if KEY_MESSAGE_RE.search(message.message):
+                    log(f"   🔍 {message.agent.value}: {message.message[:60]}...")
             
             processing_time = time.time() - start_time
             result = orchestrator.get_result()
@@ -145,15 +181,15 @@ class DeploymentVerifier:
             money_spent = final_stats["today_spend"] - initial_stats["today_spend"]
             
             # Analyze results
-            uniqueness_ratio = len(unique_responses) / max(len(messages), 1)
+            uniqueness_ratio = len(unique_responses) / max(message_count, 1)
             has_enhanced_image = bool(result.enhanced_image_base64)
             
-            print(f"\n   📊 RESULTS:")
-            print(f"      Processing time: {processing_time:.1f}s")
-            print(f"      Messages: {len(messages)} (uniqueness: {uniqueness_ratio:.1%})")
-            print(f"      API calls: {api_calls_made} (${money_spent:.3f} spent)")
-            print(f"      Enhanced image: {'✅' if has_enhanced_image else '❌'}")
-            print(f"      Confidence: {result.overall_confidence:.1f}%")
+            log(f"\n   📊 RESULTS:")
+            log(f"      Processing time: {processing_time:.1f}s")
+            log(f"      Messages: {message_count} (uniqueness: {uniqueness_ratio:.1%})")
+            log(f"      API calls: {api_calls_made} (${money_spent:.3f} spent)")
+            log(f"      Enhanced image: {'✅' if has_enhanced_image else '❌'}")
+            log(f"      Confidence: {result.overall_confidence:.1f}%")
             
             # Determine if agents are truly agentic
             is_agentic = (
@@ -174,59 +210,62 @@ class DeploymentVerifier:
             }
             
             if is_agentic:
-                print(f"   ✅ AGENTS ARE TRULY AGENTIC!")
+                log(f"   ✅ AGENTS ARE TRULY AGENTIC!")
             else:
-                print(f"   ❌ Agents may be using fallback logic")
+                log(f"   ❌ Agents may be using fallback logic")
             
             return is_agentic
             
         except Exception as e:
-            print(f"   ❌ Backend test failed: {e}")
+            log(f"   ❌ Backend test failed: {e}")
             self.results["backend_agents"] = {"passed": False, "error": str(e)}
             return False
     
-    def test_frontend_slider(self):
+    def test_frontend_slider(self, log=print):
         """Test frontend slider auto-change functionality"""
-        print("\n🎨 STEP 4: Frontend Slider Testing")
-        print("-" * 50)
+        log("\n🎨 STEP 4: Frontend Slider Testing")
+        log("-" * 50)
         
         try:
-            # Check if npm test is available
+            # Check if npm test is available. Output stays as bytes: only the
+            # report tail and any error text ever need decoding.
             result = subprocess.run(["npm", "test", "--", "--run"], 
-                                  capture_output=True, text=True, timeout=60)
+                                  capture_output=True, timeout=60)
             
             if result.returncode == 0:
-                print(f"   ✅ Frontend tests passed")
+                log(f"   ✅ Frontend tests passed")
                 
                 # Look for specific test results
-                if "ImageComparison" in result.stdout:
-                    print(f"   ✅ ImageComparison tests included")
+                if b"ImageComparison" in result.stdout:
+                    log(f"   ✅ ImageComparison tests included")
                 
-                self.results["frontend_slider"] = {"passed": True, "output": result.stdout}
+                output = result.stdout[-NPM_OUTPUT_TAIL_BYTES:].decode("utf-8", errors="replace")
+                self.results["frontend_slider"] = {"passed": True, "output": output}
                 return True
             else:
-                print(f"   ❌ Frontend tests failed")
-                print(f"   Error: {result.stderr}")
-                self.results["frontend_slider"] = {"passed": False, "error": result.stderr}
+                error = result.stderr.decode("utf-8", errors="replace")
+                log(f"   ❌ Frontend tests failed")
+                log(f"   Error: {error}")
+                self.results["frontend_slider"] = {"passed": False, "error": error}
                 return False
                 
         except subprocess.TimeoutExpired:
-            print(f"   ⚠️  Frontend tests timed out (may still be working)")
+            log(f"   ⚠️  Frontend tests timed out (may still be working)")
             self.results["frontend_slider"] = {"passed": False, "error": "Timeout"}
             return False
         except FileNotFoundError:
-            print(f"   ⚠️  npm not available - skipping frontend tests")
+            log(f"   ⚠️  npm not available - skipping frontend tests")
             self.results["frontend_slider"] = {"passed": True, "skipped": True}
             return True
         except Exception as e:
-            print(f"   ❌ Frontend test error: {e}")
+            log(f"   ❌ Frontend test error: {e}")
             self.results["frontend_slider"] = {"passed": False, "error": str(e)}
             return False
     
-    def check_slider_implementation(self):
+    def check_slider_implementation(self, log=print):
         """Verify slider auto-change implementation in code"""
-        print("\n🔍 STEP 5: Slider Implementation Check")
-        print("-" * 50)
+        log("\n🔍 STEP 5: Slider Implementation Check")
+        log("-" * 50)
         
         try:
             # Read ImageComparison component
@@ -235,20 +274,17 @@ class DeploymentVerifier:
             
             # Check for auto-reveal functionality
             checks = {
-                "autoReveal prop": "autoReveal" in content,
-                "useEffect for animation": "useEffect" in content and "animate" in content,
-                "slider position state": "sliderPosition" in content and "useState" in content,
-                "requestAnimationFrame": "requestAnimationFrame" in content,
-                "auto-reveal message": "Watch the AI restoration reveal" in content
+                check_name: all(token in content for token in tokens)
+                for check_name, tokens in SLIDER_CHECKS
             }
             
             passed_checks = 0
             for check_name, passed in checks.items():
                 if passed:
-                    print(f"   ✅ {check_name}")
+                    log(f"   ✅ {check_name}")
                     passed_checks += 1
                 else:
-                    print(f"   ❌ {check_name}")
+                    log(f"   ❌ {check_name}")
             
             implementation_complete = passed_checks >= 4
             
@@ -259,14 +295,14 @@ class DeploymentVerifier:
             }
             
             if implementation_complete:
-                print(f"   ✅ Slider auto-change implementation complete")
+                log(f"   ✅ Slider auto-change implementation complete")
             else:
-                print(f"   ❌ Slider implementation incomplete ({passed_checks}/{len(checks)})")
+                log(f"   ❌ Slider implementation incomplete ({passed_checks}/{len(checks)})")
             
             return implementation_complete
             
         except Exception as e:
-            print(f"   ❌ Code check failed: {e}")
+            log(f"   ❌ Code check failed: {e}")
             self.results["slider_implementation"] = {"passed": False, "error": str(e)}
             return False
     
@@ -277,12 +313,30 @@ class DeploymentVerifier:
         print("Verifying system is ready for production deployment")
         print("=" * 60)
         
-        # Run all verification steps
+        # Every later step needs the required files. Beyond that the steps are
+        # independent, so the blocking checks run in worker threads alongside
+        # each other and the npm suite overlaps the backend run. Concurrent
+        # steps log into their own buffers, printed in step order afterwards.
+        loop = asyncio.get_running_loop()
         step1 = self.check_file_structure()
-        step2 = self.check_environment_setup() if step1 else False
-        step3 = await self.test_backend_agents() if step2 else False
-        step4 = self.test_frontend_slider() if step3 else False
-        step5 = self.check_slider_implementation() if step4 else False
+        
+        if step1:
+            logs = {step: [] for step in (2, 3, 4, 5)}
+            step2, step5 = await asyncio.gather(
+                loop.run_in_executor(None, self.check_environment_setup, logs[2].append),
+                loop.run_in_executor(None, self.check_slider_implementation, logs[5].append),
+            )
+            _print_lines(logs[2])
+            
+            print("\n⏳ Running backend agents and frontend tests...")
+            step3, step4 = await asyncio.gather(
+                self.test_backend_agents(logs[3].append) if step2 else _skipped(),
+                loop.run_in_executor(None, self.test_frontend_slider, logs[4].append),
+            )
+            for step in (3, 4, 5):
+                _print_lines(logs[step])
+        else:
+            step2 = step3 = step4 = step5 = False
         
         total_time = time.time() - self.start_time
         
@@ -308,15 +362,16 @@ class DeploymentVerifier:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = f"deployment_verification_{timestamp}.json"
         
-        with open(report_file, 'w') as f:
-            json.dump({
-                "timestamp": datetime.now().isoformat(),
-                "total_time_seconds": total_time,
-                "steps_passed": steps_passed,
-                "steps_total": 5,
-                "verification_results": self.results,
-                "deployment_ready": steps_passed >= 4
-            }, f, indent=2)
+        # Encode in one pass and write once; json.dump with indent issues a
+        # write per token
+        Path(report_file).write_text(json.dumps({
+            "timestamp": datetime.now().isoformat(),
+            "total_time_seconds": total_time,
+            "steps_passed": steps_passed,
+            "steps_total": 5,
+            "verification_results": self.results,
+            "deployment_ready": steps_passed >= 4
+        }, indent=2))
         
         print(f"\n💾 Verification report saved: {report_file}")
         